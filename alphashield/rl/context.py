@@ -99,6 +99,73 @@ def get_context_dimension() -> int:
     return 13
 
 
+# Per-agent discrete action spaces, built once at import rather than on every lookup
+_ACTION_SPACES: Dict[str, Dict[str, Any]] = {
+    'Lender': {
+        'n_actions': 9,
+        'actions': [
+            'approve_standard',
+            'approve_reduced_rate',
+            'approve_extended_term',
+            'revise_amount_down',
+            'revise_amount_up',
+            'request_more_info',
+            'deny_high_risk',
+            'deny_insufficient_income',
+            'defer_review'
+        ]
+    },
+    'AlphaTrading': {
+        'n_actions': 5,
+        'actions': [
+            'conservative_allocation',
+            'balanced_allocation',
+            'growth_allocation',
+            'rebalance_defensive',
+            'rebalance_aggressive'
+        ]
+    },
+    'SpendingGuard': {
+        'n_actions': 4,
+        'actions': [
+            'no_alert',
+            'soft_warning',
+            'strong_warning',
+            'block_transaction'
+        ]
+    },
+    'BudgetAnalyzer': {
+        'n_actions': 5,
+        'actions': [
+            'no_changes',
+            'minor_adjustments',
+            'major_reallocation',
+            'emergency_mode',
+            'savings_optimization'
+        ]
+    },
+    'TaxOptimizer': {
+        'n_actions': 4,
+        'actions': [
+            'standard_deduction',
+            'itemized_deduction',
+            'retirement_optimization',
+            'aggressive_optimization'
+        ]
+    },
+    'ContractReview': {
+        'n_actions': 3,
+        'actions': [
+            'approve_contract',
+            'request_revisions',
+            'reject_contract'
+        ]
+    }
+}
+
+_DEFAULT_ACTION_SPACE: Dict[str, Any] = {'n_actions': 3, 'actions': ['low', 'medium', 'high']}
+
+
 def build_action_space(agent_name: str) -> Dict[str, Any]:
     """Define action space for a given agent.
     
@@ -110,69 +177,8 @@ def build_action_space(agent_name: str) -> Dict[str, Any]:
     Returns
     -------
     dict
-        Action space definition with number of actions and descriptions
+        Action space definition with number of actions and descriptions.
+        A fresh copy, so callers may modify it without touching the shared table.
     """
-    action_spaces = {
-        'Lender': {
-            'n_actions': 9,
-            'actions': [
-                'approve_standard',
-                'approve_reduced_rate',
-                'approve_extended_term',
-                'revise_amount_down',
-                'revise_amount_up',
-                'request_more_info',
-                'deny_high_risk',
-                'deny_insufficient_income',
-                'defer_review'
-            ]
-        },
-        'AlphaTrading': {
-            'n_actions': 5,
-            'actions': [
-                'conservative_allocation',
-                'balanced_allocation',
-                'growth_allocation',
-                'rebalance_defensive',
-                'rebalance_aggressive'
-            ]
-        },
-        'SpendingGuard': {
-            'n_actions': 4,
-            'actions': [
-                'no_alert',
-                'soft_warning',
-                'strong_warning',
-                'block_transaction'
-            ]
-        },
-        'BudgetAnalyzer': {
-            'n_actions': 5,
-            'actions': [
-                'no_changes',
-                'minor_adjustments',
-                'major_reallocation',
-                'emergency_mode',
-                'savings_optimization'
-            ]
-        },
-        'TaxOptimizer': {
-            'n_actions': 4,
-            'actions': [
-                'standard_deduction',
-                'itemized_deduction',
-                'retirement_optimization',
-                'aggressive_optimization'
-            ]
-        },
-        'ContractReview': {
-            'n_actions': 3,
-            'actions': [
-                'approve_contract',
-                'request_revisions',
-                'reject_contract'
-            ]
-        }
-    }
-    
-    return action_spaces.get(agent_name, {'n_actions': 3, 'actions': ['low', 'medium', 'high']})
+    space = _ACTION_SPACES.get(agent_name, _DEFAULT_ACTION_SPACE)
+    return {'n_actions': space['n_actions'], 'actions': list(space['actions'])}
@@ -41,6 +41,7 @@ from typing import Any, Optional
 from .base import (
     AccountInfo,
     Bar,
+    BarBatch,
     BrokerAdapter,
     BrokerError,
     ConnectionError,
@@ -56,11 +57,28 @@ from .base import (
     PositionError,
     Quote,
     TimeInForce,
+    _to_datetime64,
 )
 
 
 logger = logging.getLogger(__name__)
 
+# Alpaca order status strings -> our OrderStatus (several Alpaca states collapse onto one)
+_ORDER_STATUS_FROM_ALPACA = {
+    "pending_new": OrderStatus.PENDING,
+    "new": OrderStatus.SUBMITTED,
+    "accepted": OrderStatus.SUBMITTED,
+    "partially_filled": OrderStatus.PARTIAL,
+    "filled": OrderStatus.FILLED,
+    "done_for_day": OrderStatus.FILLED,
+    "canceled": OrderStatus.CANCELLED,
+    "cancelled": OrderStatus.CANCELLED,
+    "expired": OrderStatus.EXPIRED,
+    "rejected": OrderStatus.REJECTED,
+    "pending_cancel": OrderStatus.PENDING,
+    "pending_replace": OrderStatus.PENDING,
+}
+
 
 class AlpacaAdapter(BrokerAdapter):
     """
@@ -162,6 +180,8 @@ class AlpacaAdapter(BrokerAdapter):
             self._AlpacaOrderSide = AlpacaOrderSide
             self._AlpacaOrderType = AlpacaOrderType
             self._AlpacaTimeInForce = AlpacaTimeInForce
+            # Resolve our TimeInForce -> Alpaca member once (names match one-to-one)
+            self._tif_out = {tif: getattr(AlpacaTimeInForce, tif.name) for tif in TimeInForce}
             self._QueryOrderStatus = QueryOrderStatus
             self._StockBarsRequest = StockBarsRequest
             self._StockLatestBarRequest = StockLatestBarRequest
@@ -580,12 +600,12 @@ class AlpacaAdapter(BrokerAdapter):
                     bars.append(Bar(
                         symbol=symbol.upper(),
                         timestamp=bar.timestamp,
-                        open=Decimal(str(bar.open)),
-                        high=Decimal(str(bar.high)),
-                        low=Decimal(str(bar.low)),
-                        close=Decimal(str(bar.close)),
+                        open=float(bar.open),
+                        high=float(bar.high),
+                        low=float(bar.low),
+                        close=float(bar.close),
                         volume=bar.volume,
-                        vwap=Decimal(str(bar.vwap)) if bar.vwap else None,
+                        vwap=float(bar.vwap) if bar.vwap else None,
                         trade_count=bar.trade_count,
                     ))
             
@@ -594,6 +614,56 @@ class AlpacaAdapter(BrokerAdapter):
         except Exception as e:
             raise MarketDataError(f"Failed to get bars for {symbol}: {e}") from e
     
+    async def get_bars_batch(
+        self,
+        symbol: str,
+        timeframe: str,
+        start: datetime,
+        end: Optional[datetime] = None,
+        limit: int = 1000,
+    ) -> BarBatch:
+        """
+        Get historical price bars as column arrays.
+        
+        Drains the SDK response straight into preallocated float64/int64
+        arrays, skipping the per-bar Bar object construction done by get_bars.
+        """
+        if not self._data_client:
+            raise ConnectionError("Not connected to Alpaca")
+            
+        try:
+            tf = self._parse_timeframe(timeframe)
+            end = end or datetime.now(timezone.utc)
+            sym = symbol.upper()
+            
+            request = self._StockBarsRequest(
+                symbol_or_symbols=sym,
+                timeframe=tf,
+                start=start,
+                end=end,
+                limit=limit,
+            )
+            
+            bars_data = await self._execute_with_retry(
+                self._data_client.get_stock_bars,
+                request
+            )
+            
+            raw = list(bars_data[sym]) if sym in bars_data else []
+            batch = BarBatch.empty(sym, len(raw))
+            for i, bar in enumerate(raw):
+                batch.timestamp[i] = _to_datetime64(bar.timestamp)
+                batch.open[i] = bar.open
+                batch.high[i] = bar.high
+                batch.low[i] = bar.low
+                batch.close[i] = bar.close
+                batch.volume[i] = bar.volume
+            
+            return batch
+            
+        except Exception as e:
+            raise MarketDataError(f"Failed to get bars for {symbol}: {e}") from e
+    
     async def get_latest_bar(self, symbol: str) -> Optional[Bar]:
         """Get the latest price bar for a symbol."""
         if not self._data_client:
@@ -614,12 +684,12 @@ class AlpacaAdapter(BrokerAdapter):
                 return Bar(
                     symbol=symbol.upper(),
                     timestamp=bar.timestamp,
-                    open=Decimal(str(bar.open)),
-                    high=Decimal(str(bar.high)),
-                    low=Decimal(str(bar.low)),
-                    close=Decimal(str(bar.close)),
+                    open=float(bar.open),
+                    high=float(bar.high),
+                    low=float(bar.low),
+                    close=float(bar.close),
                     volume=bar.volume,
-                    vwap=Decimal(str(bar.vwap)) if bar.vwap else None,
+                    vwap=float(bar.vwap) if bar.vwap else None,
                     trade_count=bar.trade_count,
                 )
             return None
@@ -647,9 +717,9 @@ class AlpacaAdapter(BrokerAdapter):
                 return Quote(
                     symbol=symbol.upper(),
                     timestamp=quote.timestamp,
-                    bid=Decimal(str(quote.bid_price)),
+                    bid=float(quote.bid_price),
                     bid_size=quote.bid_size,
-                    ask=Decimal(str(quote.ask_price)),
+                    ask=float(quote.ask_price),
                     ask_size=quote.ask_size,
                 )
             return None
@@ -678,9 +748,9 @@ class AlpacaAdapter(BrokerAdapter):
                 result[symbol] = Quote(
                     symbol=symbol,
                     timestamp=quote.timestamp,
-                    bid=Decimal(str(quote.bid_price)),
+                    bid=float(quote.bid_price),
                     bid_size=quote.bid_size,
-                    ask=Decimal(str(quote.ask_price)),
+                    ask=float(quote.ask_price),
                     ask_size=quote.ask_size,
                 )
             
@@ -755,59 +825,19 @@ class AlpacaAdapter(BrokerAdapter):
     
     def _map_order_status(self, status) -> OrderStatus:
         """Map Alpaca order status to our OrderStatus."""
-        status_str = str(status).lower()
-        mapping = {
-            "pending_new": OrderStatus.PENDING,
-            "new": OrderStatus.SUBMITTED,
-            "accepted": OrderStatus.SUBMITTED,
-            "partially_filled": OrderStatus.PARTIAL,
-            "filled": OrderStatus.FILLED,
-            "done_for_day": OrderStatus.FILLED,
-            "canceled": OrderStatus.CANCELLED,
-            "cancelled": OrderStatus.CANCELLED,
-            "expired": OrderStatus.EXPIRED,
-            "rejected": OrderStatus.REJECTED,
-            "pending_cancel": OrderStatus.PENDING,
-            "pending_replace": OrderStatus.PENDING,
-        }
-        return mapping.get(status_str, OrderStatus.PENDING)
+        return _ORDER_STATUS_FROM_ALPACA.get(str(status).lower(), OrderStatus.PENDING)
     
     def _map_order_type(self, order_type) -> OrderType:
         """Map Alpaca order type to our OrderType."""
-        type_str = str(order_type).lower()
-        mapping = {
-            "market": OrderType.MARKET,
-            "limit": OrderType.LIMIT,
-            "stop": OrderType.STOP,
-            "stop_limit": OrderType.STOP_LIMIT,
-            "trailing_stop": OrderType.TRAILING_STOP,
-        }
-        return mapping.get(type_str, OrderType.MARKET)
+        return OrderType.by_value(str(order_type).lower(), OrderType.MARKET)
     
     def _map_time_in_force(self, tif: TimeInForce):
         """Map our TimeInForce to Alpaca's."""
-        mapping = {
-            TimeInForce.DAY: self._AlpacaTimeInForce.DAY,
-            TimeInForce.GTC: self._AlpacaTimeInForce.GTC,
-            TimeInForce.IOC: self._AlpacaTimeInForce.IOC,
-            TimeInForce.FOK: self._AlpacaTimeInForce.FOK,
-            TimeInForce.OPG: self._AlpacaTimeInForce.OPG,
-            TimeInForce.CLS: self._AlpacaTimeInForce.CLS,
-        }
-        return mapping.get(tif, self._AlpacaTimeInForce.DAY)
+        return self._tif_out.get(tif, self._AlpacaTimeInForce.DAY)
     
     def _map_tif_from_alpaca(self, alpaca_tif) -> TimeInForce:
         """Map Alpaca's TimeInForce to ours."""
-        tif_str = str(alpaca_tif).lower()
-        mapping = {
-            "day": TimeInForce.DAY,
-            "gtc": TimeInForce.GTC,
-            "ioc": TimeInForce.IOC,
-            "fok": TimeInForce.FOK,
-            "opg": TimeInForce.OPG,
-            "cls": TimeInForce.CLS,
-        }
-        return mapping.get(tif_str, TimeInForce.DAY)
+        return TimeInForce.by_value(str(alpaca_tif).lower(), TimeInForce.DAY)
     
     def _parse_timeframe(self, timeframe: str):
         """Parse timeframe string to Alpaca TimeFrame."""
@@ -7,13 +7,24 @@ consistent behavior across different trading platforms.
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
 from decimal import Decimal
 from enum import Enum
 from typing import Any, Optional
 
+import numpy as np
 
-class OrderStatus(Enum):
+
+class _ValueLookupMixin:
+    """Direct value -> member lookup that skips Enum.__call__ dispatch."""
+
+    @classmethod
+    def by_value(cls, value: Any, default: Any = None) -> Any:
+        """Return the member with the given value, or default if none matches."""
+        return cls._value2member_map_.get(value, default)
+
+
+class OrderStatus(_ValueLookupMixin, Enum):
     """Order execution status."""
     PENDING = "pending"
     SUBMITTED = "submitted"
@@ -24,13 +35,13 @@ class OrderStatus(Enum):
     EXPIRED = "expired"
 
 
-class OrderSide(Enum):
+class OrderSide(_ValueLookupMixin, Enum):
     """Order direction."""
     BUY = "buy"
     SELL = "sell"
 
 
-class OrderType(Enum):
+class OrderType(_ValueLookupMixin, Enum):
     """Order execution type."""
     MARKET = "market"
     LIMIT = "limit"
@@ -39,7 +50,7 @@ class OrderType(Enum):
     TRAILING_STOP = "trailing_stop"
 
 
-class TimeInForce(Enum):
+class TimeInForce(_ValueLookupMixin, Enum):
     """Order time-in-force."""
     DAY = "day"
     GTC = "gtc"  # Good 'til cancelled
@@ -49,7 +60,7 @@ class TimeInForce(Enum):
     CLS = "cls"  # Market on close
 
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     """Represents a portfolio position."""
     symbol: str
@@ -70,7 +81,7 @@ class Position:
         return self.unrealized_pnl > 0
 
 
-@dataclass
+@dataclass(slots=True)
 class Order:
     """Represents a trading order."""
     id: str
@@ -99,7 +110,7 @@ class Order:
         return self.status in (OrderStatus.PENDING, OrderStatus.SUBMITTED, OrderStatus.PARTIAL)
 
 
-@dataclass
+@dataclass(slots=True)
 class AccountInfo:
     """Account summary information."""
     account_id: str
@@ -121,37 +132,91 @@ class AccountInfo:
     account_blocked: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class Bar:
-    """Price bar (OHLCV) data."""
+    """Price bar (OHLCV) data. Market data uses floats; Decimal is kept for ledger fields."""
     symbol: str
     timestamp: datetime
-    open: Decimal
-    high: Decimal
-    low: Decimal
-    close: Decimal
+    open: float
+    high: float
+    low: float
+    close: float
     volume: int
-    vwap: Optional[Decimal] = None
+    vwap: Optional[float] = None
     trade_count: Optional[int] = None
 
 
+def _to_datetime64(ts: datetime) -> np.datetime64:
+    """Convert a (possibly tz-aware) datetime to a naive UTC datetime64[ns]."""
+    if ts.tzinfo is not None:
+        ts = ts.astimezone(timezone.utc).replace(tzinfo=None)
+    return np.datetime64(ts, "ns")
+
+
 @dataclass
+class BarBatch:
+    """
+    Column-oriented OHLCV bars for a single symbol.
+
+    Holds one NumPy array per field instead of a list of per-bar Bar
+    objects, so return/volatility math can run on the arrays directly.
+    Timestamps are naive UTC datetime64[ns].
+    """
+    symbol: str
+    timestamp: np.ndarray
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+
+    def __len__(self) -> int:
+        return int(self.close.shape[0])
+
+    @classmethod
+    def empty(cls, symbol: str, size: int = 0) -> "BarBatch":
+        """Allocate a batch of the given size (values uninitialised)."""
+        return cls(
+            symbol=symbol,
+            timestamp=np.empty(size, dtype="datetime64[ns]"),
+            open=np.empty(size, dtype=np.float64),
+            high=np.empty(size, dtype=np.float64),
+            low=np.empty(size, dtype=np.float64),
+            close=np.empty(size, dtype=np.float64),
+            volume=np.empty(size, dtype=np.int64),
+        )
+
+    @classmethod
+    def from_bars(cls, symbol: str, bars: list[Bar]) -> "BarBatch":
+        """Build a batch from a list of Bar objects."""
+        batch = cls.empty(symbol, len(bars))
+        for i, bar in enumerate(bars):
+            batch.timestamp[i] = _to_datetime64(bar.timestamp)
+            batch.open[i] = bar.open
+            batch.high[i] = bar.high
+            batch.low[i] = bar.low
+            batch.close[i] = bar.close
+            batch.volume[i] = bar.volume
+        return batch
+
+
+@dataclass(slots=True)
 class Quote:
     """Real-time quote data."""
     symbol: str
     timestamp: datetime
-    bid: Decimal
+    bid: float
     bid_size: int
-    ask: Decimal
+    ask: float
     ask_size: int
     
     @property
-    def spread(self) -> Decimal:
+    def spread(self) -> float:
         """Calculate bid-ask spread."""
         return self.ask - self.bid
     
     @property
-    def mid_price(self) -> Decimal:
+    def mid_price(self) -> float:
         """Calculate mid-point price."""
         return (self.bid + self.ask) / 2
 
@@ -308,6 +373,27 @@ class BrokerAdapter(ABC):
         """
         pass
     
+    async def get_bars_batch(
+        self,
+        symbol: str,
+        timeframe: str,
+        start: datetime,
+        end: Optional[datetime] = None,
+        limit: int = 1000,
+    ) -> BarBatch:
+        """
+        Get historical price bars as column arrays.
+        
+        Same arguments as get_bars. The default implementation converts the
+        result of get_bars; adapters should override it to fill the arrays
+        straight from the broker response.
+        
+        Returns:
+            BarBatch with one array per OHLCV field.
+        """
+        bars = await self.get_bars(symbol, timeframe, start, end=end, limit=limit)
+        return BarBatch.from_bars(symbol.upper(), bars)
+    
     @abstractmethod
     async def get_latest_bar(self, symbol: str) -> Optional[Bar]:
         """Get the latest price bar for a symbol."""
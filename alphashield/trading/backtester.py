@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import os
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from typing import Dict, List, Any
+from typing import Dict, Any, List, Sequence
 
 import numpy as np
 import pandas as pd
@@ -18,11 +20,25 @@ class BacktestResult:
 
 
 from .data_validator import validate_prices
-from .coverage_monitor import monthly_payment, coverage_ratio as compute_cr, is_coverage_ok
+from .coverage_monitor import monthly_payment, coverage_ratio as compute_cr
 from .portfolio_optimizer import PortfolioOptimizer, OptimizerConfig
-from .signal_generator import momentum_signal, trend_sma200_signal, mean_reversion_signal, combine_signals
-from .execution_simulator import simulate_execution
-from alphashield.utils.metrics import time_block
+from .signal_generator import combined_signal, signal_to_expected_return
+from .execution_simulator import half_spreads, simulate_execution, simulate_execution_arrays
+from alphashield.utils.metrics import time_block, coverage_breach_inc
+
+
+# Per-worker state for Backtester.run_parallel: the price frame is shipped once per
+# worker process rather than once per run
+_WORKER_STATE: Dict[str, Any] = {}
+
+
+def _init_worker(config: Dict[str, Any], prices: pd.DataFrame) -> None:
+    _WORKER_STATE["backtester"] = Backtester(config)
+    _WORKER_STATE["prices"] = prices
+
+
+def _run_in_worker(run_kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    return _WORKER_STATE["backtester"].run(_WORKER_STATE["prices"], **run_kwargs)
 
 
 class Backtester:
@@ -39,23 +55,27 @@ class Backtester:
             return 0.0
         return float((series.iloc[-1] / series.iloc[0]) ** (1 / years) - 1.0)
 
-    def _volatility(self, returns: pd.Series) -> float:
-        if returns.std(ddof=0) == 0:
-            return 0.0
-        return float(returns.std(ddof=0) * np.sqrt(252))
-
-    def _sharpe(self, returns: pd.Series) -> float:
-        std = returns.std(ddof=0)
+    def _return_stats(self, series: pd.Series) -> tuple[float, float]:
+        """Annualized (volatility, sharpe) of period returns, from one pass over the NAV array."""
+        a = series.to_numpy(dtype=float)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            r = a[1:] / a[:-1] - 1.0
+        r = r[~np.isnan(r)]
+        if r.size == 0:
+            return 0.0, 0.0
+        std = r.std()
         if std == 0:
-            return 0.0
-        return float(returns.mean() / std * np.sqrt(252))
+            return 0.0, 0.0
+        return float(std * np.sqrt(252)), float(r.mean() / std * np.sqrt(252))
 
     def _max_dd(self, series: pd.Series) -> float:
-        if series.empty:
+        a = series.to_numpy(dtype=float)
+        if a.size == 0:
             return 0.0
-        roll_max = series.cummax()
-        dd = (roll_max - series) / roll_max.replace(0, np.nan)
-        return float(dd.max(skipna=True))
+        # Single pass: running max + drawdown; zero peaks yield NaN and are skipped
+        roll_max = np.fmax.accumulate(a)
+        dd = np.divide(roll_max - a, roll_max, out=np.full_like(a, np.nan), where=roll_max != 0)
+        return float(np.fmax.reduce(dd))
 
     def run(
         self,
@@ -78,6 +98,9 @@ class Backtester:
         tr_w = int(sig_cfg.get("trend_window", 200))
         mr_w = int(sig_cfg.get("meanrev_window", 20))
         wts = sig_cfg.get("weights", {"momentum": 0.5, "trend": 0.3, "meanrev": 0.2})
+        # Signals only read the latest value of each rolling statistic, so they never need
+        # more than the longest lookback (+1 row for pct_change) of trailing history
+        sig_lookback = max(mom_w, tr_w, mr_w) + 1
 
         opt_cfg = self.config.get("optimizer", {})
         opt = PortfolioOptimizer(
@@ -103,47 +126,85 @@ class Backtester:
 
         # 3) Setup loop
         portfolio_value = float(initial_capital)
-        current_weights = pd.Series(0.0, index=prices.columns)
-        nav_series: List[float] = []
-        dates = prices.resample(rebalance_freq).last().index
+        cols = prices.columns
+        # Weights held as an array aligned to prices.columns; only wrapped for the simulator
+        current_weights = np.zeros(len(cols))
+        scratch = np.empty(len(cols))  # reused for per-rebalance weight deltas
+        # Rebalance on period-end labels that are actual rows; resampling the index alone
+        # avoids building a price-shaped temporary
+        period_ends = prices.index.to_series().resample(rebalance_freq).last().index
+        dates = period_ends.intersection(prices.index)
+        # Positional lookups computed once so each rebalance slices by offset
+        price_pos = prices.index.get_indexer(dates)
+        nav_arr = np.empty(len(dates))
+        n_nav = 0
+        ret_end = returns.index.searchsorted(dates, side="right")
+        # Returns are already NaN-free (dropna above), so the optimizer can fold each new
+        # month into running covariance moments instead of re-estimating from scratch
+        returns_np = returns.to_numpy(dtype=float)
+        # Price matrix for mark-to-market; missing prices contribute nothing, as with skipna sums.
+        # The simulator skips non-positive prices, so the zero-filled rows also serve execution
+        raw_prices = prices.to_numpy(dtype=float)
+        mtm_prices = np.nan_to_num(raw_prices, nan=0.0)
+        # Momentum pads gaps as pct_change does, which can reach back past the lookback. Per
+        # row, the last row holding a valid price of each column (-1 before the first one)
+        last_valid = None
+        if np.isnan(raw_prices).any():
+            rows = np.arange(raw_prices.shape[0])[:, None]
+            last_valid = np.maximum.accumulate(np.where(np.isnan(raw_prices), -1, rows), axis=0)
+        half_spread = half_spreads(cols, spread_bps)
 
         mpay = monthly_payment(
             float(loan_params.get("principal", 100000.0)),
             float(loan_params.get("rate", 0.08)),
             int(loan_params.get("term_months", 36)),
         )
+        # coverage_ratio is linear in NAV, so hoist the per-dollar ratio; is_coverage_ok
+        # reduces to a single comparison against the stricter of the two thresholds
+        cr_per_nav = compute_cr(1.0, mpay, exp_ret)
+        coverage_floor = max(target_ratio, emergency_ratio)
         coverage_ok_count = 0
         total_steps = 0
         total_turnover = 0.0
 
-        for dt in dates:
-            if dt not in prices.index:
-                continue
-            window = prices.loc[:dt]
-            if window.shape[0] < 252:
+        for k in range(len(dates)):
+            i = int(price_pos[k])
+            if i + 1 < 252:
                 # hold weights
-                nav_series.append(portfolio_value)
+                nav_arr[n_nav] = portfolio_value
+                n_nav += 1
                 continue
+            start = max(0, i + 1 - sig_lookback)
+            if last_valid is not None:
+                # Reach back to the last valid price behind a gap at the window start, so
+                # padding sees the same value as over the full history
+                padded_from = last_valid[start][last_valid[start] >= 0]
+                if padded_from.size:
+                    start = min(start, int(padded_from.min()))
+            window = prices.iloc[start : i + 1]
 
             # Signals in [0,1]
             with time_block("signals"):
-                mom = momentum_signal(window, window_6m=mom_w//2, window_12m=mom_w)
-                tr = trend_sma200_signal(window, window=tr_w)
-                mr = mean_reversion_signal(window, window=mr_w)
-                combined = combine_signals({"momentum": mom, "trend": tr, "meanrev": mr}, wts)
+                combined = combined_signal(
+                    window,
+                    window_6m=mom_w // 2,
+                    window_12m=mom_w,
+                    trend_window=tr_w,
+                    meanrev_window=mr_w,
+                    weights=wts,
+                )
 
-            # Expected returns proxy: map [0,1] -> [-0.05, +0.15] annualized
-            mu = (combined - 0.5) * 0.20
+            # Expected returns proxy: map [0,1] -> [-0.10, +0.10] annualized
+            mu = signal_to_expected_return(combined)
 
             # Optimize
             with time_block("optimize"):
-                w, _info = opt.optimize(mu, returns.loc[:dt])
+                w, _info = opt.optimize_streaming(mu, returns_np, int(ret_end[k]))
 
             # Risk/coverage guard simplified: enforce coverage target -> if fail, tilt defensive
-            cr = compute_cr(portfolio_value, mpay, exp_ret)
+            cr = portfolio_value * cr_per_nav if mpay > 0 else cr_per_nav
             cov_ok = cr >= emergency_ratio
             if not cov_ok:
-                from alphashield.utils.metrics import coverage_breach_inc
                 try:
                     coverage_breach_inc()
                 except Exception:
@@ -153,40 +214,54 @@ class Backtester:
                     shift = min(0.2, w.get("VTI", 0.0))
                     w["VTI"] = max(0.0, w.get("VTI", 0.0) - shift)
                     w["BND"] = min(1.0, w.get("BND", 0.0) + shift)
-                w = w / max(w.sum(), 1e-9)
+                w /= max(w.sum(), 1e-9)
 
             # Execution simulation: no ADV data, so unlimited except adv_limit ignored
-            prices_row = prices.loc[dt]
             with time_block("execution"):
-                exec_res = simulate_execution(
-                    current_weights=current_weights,
-                    target_weights=w,
-                    prices=prices_row,
-                    adv=None,
-                    spread_bps=spread_bps,
-                    commission_per_trade=commission,
-                    adv_limit=adv_limit,
-                    portfolio_value=portfolio_value,
-                )
-            new_weights = exec_res["final_weights"].reindex(prices.columns).fillna(0.0)
-            turnover = float(abs(new_weights - current_weights).sum())
+                if w.index.equals(cols):
+                    exec_res = simulate_execution_arrays(
+                        current_weights,
+                        w.to_numpy(dtype=float),
+                        mtm_prices[i],
+                        cols,
+                        half_spread,
+                        commission_per_trade=commission,
+                        portfolio_value=portfolio_value,
+                    )
+                    new_weights = exec_res["final_weights"]
+                else:
+                    exec_res = simulate_execution(
+                        current_weights=pd.Series(current_weights, index=cols),
+                        target_weights=w,
+                        prices=prices.iloc[i],
+                        adv=None,
+                        spread_bps=spread_bps,
+                        commission_per_trade=commission,
+                        adv_limit=adv_limit,
+                        portfolio_value=portfolio_value,
+                    )
+                    new_weights = exec_res["final_weights"].reindex(cols).fillna(0.0).to_numpy(dtype=float)
+            np.subtract(new_weights, current_weights, out=scratch)
+            np.abs(scratch, out=scratch)
+            turnover = float(scratch.sum())
             total_turnover += turnover
             current_weights = new_weights
 
             # Mark to market to end of month using same day close (simplified)
-            portfolio_value = float((current_weights * prices_row).sum())
-            nav_series.append(portfolio_value)
+            portfolio_value = float(current_weights @ mtm_prices[i])
+            nav_arr[n_nav] = portfolio_value
+            n_nav += 1
 
             total_steps += 1
-            if is_coverage_ok(cr, target_ratio, emergency_ratio):
+            if cr >= coverage_floor:
                 coverage_ok_count += 1
 
-        nav = pd.Series(nav_series, index=dates[: len(nav_series)])
-        rets = nav.pct_change().dropna()
+        nav = pd.Series(nav_arr[:n_nav], index=dates[:n_nav])
+        volatility, sharpe = self._return_stats(nav)
         metrics = {
             "cagr": self._cagr(nav),
-            "volatility": self._volatility(rets) if not rets.empty else 0.0,
-            "sharpe": self._sharpe(rets) if not rets.empty else 0.0,
+            "volatility": volatility,
+            "sharpe": sharpe,
             "max_drawdown": self._max_dd(nav),
             "turnover": float(total_turnover / max(total_steps, 1)),
             "coverage_adherence_pct": float(coverage_ok_count / max(total_steps, 1)),
@@ -196,3 +271,23 @@ class Backtester:
             "nav": nav,
             "metrics": metrics,
         }
+
+    def run_parallel(
+        self,
+        prices: pd.DataFrame,
+        runs: Sequence[Dict[str, Any]],
+        max_workers: int | None = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Run independent backtests over the same prices, e.g. a sweep of loans or starting
+        capital. Each entry of `runs` holds the run() keyword arguments other than prices.
+        Rebalances within one run depend on each other, so runs are the unit spread
+        across worker processes. Results come back in the order of `runs`.
+        """
+        workers = min(max_workers or os.cpu_count() or 1, len(runs))
+        if workers <= 1:
+            return [self.run(prices, **kwargs) for kwargs in runs]
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(self.config, prices)
+        ) as pool:
+            return list(pool.map(_run_in_worker, runs))
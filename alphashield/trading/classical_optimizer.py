@@ -1,14 +1,20 @@
 from __future__ import annotations
 
-from typing import Dict, Optional
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
 
 import numpy as np
 import cvxpy as cp
 
 try:
-    from sklearn.covariance import LedoitWolf
+    import quadprog
 except Exception:  # pragma: no cover - optional dependency
-    LedoitWolf = None  # type: ignore
+    quadprog = None  # type: ignore
+
+# Portfolio weights do not need ECOS's default 1e-8 tolerances
+_ECOS_TOLERANCES = {"abstol": 1e-6, "reltol": 1e-6, "feastol": 1e-7, "max_iters": 100}
+# Compiled problems kept per optimizer; the least recently used structure is evicted first
+_MAX_CACHED_PROBLEMS = 8
 
 
 class ClassicalPortfolioOptimizer:
@@ -16,6 +22,14 @@ class ClassicalPortfolioOptimizer:
     Markowitz mean-variance optimization with practical constraints and covariance shrinkage.
     """
 
+    def __init__(self, shrinkage: Optional[float] = None):
+        # Fixed shrinkage intensity in [0, 1]; None uses the Ledoit-Wolf closed form
+        self.shrinkage = shrinkage
+        # Compiled problems keyed by structure; only parameter values change per call
+        self._problems: OrderedDict[
+            Tuple, Tuple[cp.Problem, cp.Variable, Dict[str, cp.Parameter]]
+        ] = OrderedDict()
+
     def optimize(
         self,
         expected_returns: np.ndarray,
@@ -26,86 +40,171 @@ class ClassicalPortfolioOptimizer:
         if constraints is None:
             constraints = {}
         n_assets = int(expected_returns.shape[0])
-        w = cp.Variable(n_assets)
 
         Sigma = self._shrink_covariance(covariance_matrix)
 
         risk_aversion = float(constraints.get("risk_aversion", 1.0))
-        portfolio_return = expected_returns @ w
-        portfolio_risk = cp.quad_form(w, Sigma)
-        objective = cp.Maximize(portfolio_return - risk_aversion * portfolio_risk)
-
-        cons = [
-            cp.sum(w) == 1.0,
-            w >= 0.0,
-        ]
+        if risk_aversion < 0:
+            raise ValueError("risk_aversion must be non-negative")
 
+        sector_limits = constraints.get("sector_limits") or {}
+        sector_groups = tuple(tuple(int(i) for i in idx) for idx, _cap in sector_limits.values())
+        has_turnover = initial_weights is not None
         max_weight = float(constraints.get("max_weight", 0.20))
-        cons.append(w <= max_weight)
 
-        sector_limits = constraints.get("sector_limits")
-        if sector_limits:
-            for _sector, (asset_indices, max_exposure) in sector_limits.items():
-                sector_weight = cp.sum(cp.hstack([w[i] for i in asset_indices]))
-                cons.append(sector_weight <= float(max_exposure))
+        if quadprog is not None and not sector_groups and not has_turnover and risk_aversion > 0:
+            weights = self._solve_box_qp(expected_returns, Sigma, risk_aversion, max_weight)
+            if weights is not None:
+                return self._normalize(weights)
 
-        if initial_weights is not None:
-            max_turnover = float(constraints.get("max_turnover", 0.30))
-            turnover = cp.norm1(w - initial_weights)
-            cons.append(turnover <= max_turnover)
+        key = (n_assets, sector_groups, has_turnover)
+        if key in self._problems:
+            self._problems.move_to_end(key)
+        else:
+            self._problems[key] = self._build_problem(n_assets, sector_groups, has_turnover)
+            if len(self._problems) > _MAX_CACHED_PROBLEMS:
+                self._problems.popitem(last=False)
+        problem, w, params = self._problems[key]
+
+        # w' Sigma w == ||L' w||^2; folding sqrt(risk_aversion) into the factor keeps the
+        # objective DPP so CVXPY reuses its canonicalization between calls
+        params["mu"].value = np.asarray(expected_returns, dtype=float)
+        params["risk_factor"].value = np.sqrt(risk_aversion) * self._factor(Sigma).T
+        params["max_weight"].value = max_weight
+        if sector_groups:
+            params["sector_caps"].value = np.array(
+                [float(cap) for _idx, cap in sector_limits.values()], dtype=float
+            )
+        if has_turnover:
+            params["initial_weights"].value = np.asarray(initial_weights, dtype=float)
+            params["max_turnover"].value = float(constraints.get("max_turnover", 0.30))
 
-        problem = cp.Problem(objective, cons)
         try:
-            problem.solve(solver=cp.ECOS, warm_start=True)
+            problem.solve(solver=cp.CLARABEL, warm_start=True, verbose=False)
         except Exception:
-            problem.solve(warm_start=True)
+            try:
+                problem.solve(solver=cp.ECOS, warm_start=True, verbose=False, **_ECOS_TOLERANCES)
+            except Exception:
+                problem.solve(warm_start=True, verbose=False)
 
         if problem.status not in {cp.OPTIMAL, cp.OPTIMAL_INACCURATE}:
             raise ValueError(f"Optimization failed: {problem.status}")
 
-        weights = np.asarray(w.value, dtype=float)
+        return self._normalize(np.asarray(w.value, dtype=float))
+
+    @staticmethod
+    def _normalize(weights: np.ndarray) -> np.ndarray:
         # Post-process for numerical stability
         weights = np.where(weights < 0, 0.0, weights)
         total = float(weights.sum())
         if total <= 0:
             # Fallback to equal weight
-            weights = np.ones(n_assets) / n_assets
-        else:
-            weights = weights / total
-        return weights
+            return np.ones(weights.shape[0]) / weights.shape[0]
+        return weights / total
 
-    def _shrink_covariance(self, Sigma: np.ndarray) -> np.ndarray:
+    @staticmethod
+    def _solve_box_qp(
+        expected_returns: np.ndarray, Sigma: np.ndarray, risk_aversion: float, max_weight: float
+    ) -> Optional[np.ndarray]:
         """
-        Ledoit-Wolf shrinkage for stable covariance. If sklearn is unavailable,
-        fall back to diagonal loading.
+        Solve min 1/2 w'(2 ra Sigma)w - mu'w s.t. sum w = 1, 0 <= w <= max_weight with
+        quadprog directly, skipping CVXPY canonicalization. Returns None if quadprog
+        rejects the problem so the caller can fall back to CVXPY.
         """
-        # If we have return series covariance matrix, ensure symmetry/PSD tweaks
-        Sigma = np.asarray(Sigma, dtype=float)
-        Sigma = (Sigma + Sigma.T) / 2.0
+        n_assets = Sigma.shape[0]
+        eye = np.eye(n_assets)
+        # quadprog constraints are C.T @ w >= b with the first meq rows as equalities
+        C = np.hstack([np.ones((n_assets, 1)), eye, -eye])
+        b = np.concatenate([[1.0], np.zeros(n_assets), np.full(n_assets, -max_weight)])
+        try:
+            return quadprog.solve_qp(
+                2.0 * risk_aversion * Sigma, np.asarray(expected_returns, dtype=float), C, b, meq=1
+            )[0]
+        except ValueError:
+            return None
+
+    def _build_problem(
+        self, n_assets: int, sector_groups: Tuple[Tuple[int, ...], ...], has_turnover: bool
+    ) -> Tuple[cp.Problem, cp.Variable, Dict[str, cp.Parameter]]:
+        w = cp.Variable(n_assets)
+        params: Dict[str, cp.Parameter] = {
+            "mu": cp.Parameter(n_assets),
+            "risk_factor": cp.Parameter((n_assets, n_assets)),
+            "max_weight": cp.Parameter(nonneg=True),
+        }
 
-        if LedoitWolf is not None:
-            try:
-                # LedoitWolf expects samples; hack: reconstruct pseudo-samples via eigendecomposition
-                # More robust: shrink towards diagonal via heuristic when samples not available
-                lw = LedoitWolf(assume_centered=True)
-                # Create pseudo-samples by sampling from multivariate normal with Sigma
-                # Keep it small to avoid heavy compute
-                n_assets = Sigma.shape[0]
-                n_samples = max(200, 5 * n_assets)
-                rng = np.random.default_rng(42)
-                try:
-                    pseudo = rng.multivariate_normal(np.zeros(n_assets), Sigma + np.eye(n_assets) * 1e-6, size=n_samples)
-                except np.linalg.LinAlgError:
-                    pseudo = rng.standard_normal(size=(n_samples, n_assets))
-                lw.fit(pseudo)
-                return lw.covariance_
-            except Exception:
-                pass
-
-        # Fallback: simple diagonal shrinkage
-        diag = np.diag(np.diag(Sigma))
-        alpha = 0.1
-        shrunk = (1 - alpha) * Sigma + alpha * diag
-        # Ensure PSD by adding small jitter
-        shrunk += np.eye(Sigma.shape[0]) * 1e-6
-        return shrunk
+        portfolio_return = params["mu"] @ w
+        portfolio_risk = cp.sum_squares(params["risk_factor"] @ w)
+        objective = cp.Maximize(portfolio_return - portfolio_risk)
+
+        cons = [
+            cp.sum(w) == 1.0,
+            w >= 0.0,
+            w <= params["max_weight"],
+        ]
+
+        if sector_groups:
+            # One 0/1 membership row per sector; the grouping is part of the cache key, so
+            # the matrix is a constant and all sector limits become a single affine constraint
+            membership = np.zeros((len(sector_groups), n_assets))
+            for j, asset_indices in enumerate(sector_groups):
+                np.add.at(membership[j], list(asset_indices), 1.0)
+            params["sector_caps"] = cp.Parameter(len(sector_groups))
+            cons.append(membership @ w <= params["sector_caps"])
+
+        if has_turnover:
+            params["initial_weights"] = cp.Parameter(n_assets)
+            params["max_turnover"] = cp.Parameter(nonneg=True)
+            turnover = cp.norm1(w - params["initial_weights"])
+            cons.append(turnover <= params["max_turnover"])
+
+        return cp.Problem(objective, cons), w, params
+
+    @staticmethod
+    def _factor(Sigma: np.ndarray) -> np.ndarray:
+        """Lower factor L with L @ L.T == Sigma (eigen-based if Cholesky fails)."""
+        try:
+            return np.linalg.cholesky(Sigma)
+        except np.linalg.LinAlgError:
+            vals, vecs = np.linalg.eigh(Sigma)
+            return vecs * np.sqrt(np.clip(vals, 0.0, None))
+
+    def _shrink_covariance(self, Sigma: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Ledoit-Wolf linear shrinkage of Sigma toward mu * I, with mu = tr(Sigma) / p.
+
+        Only Sigma is known here, so the intensity is the closed-form Ledoit-Wolf
+        estimate for a Gaussian sample of max(200, 5p) draws from Sigma, i.e.
+        min(b2, d2) / d2 with d2 = ||Sigma - mu I||_F^2 and
+        b2 = (||Sigma||_F^2 + tr(Sigma)^2) / n_samples.
+
+        The result is written into ``out`` when given (which may be Sigma itself),
+        otherwise into a single new array; no other p x p temporaries are created.
+        """
+        Sigma = np.asarray(Sigma, dtype=float)
+        if out is None:
+            out = np.empty_like(Sigma)
+        if out is Sigma:
+            # Sigma.T is a view of the output, so symmetrize through a copy of it
+            np.add(Sigma, Sigma.T.copy(), out=out)
+        else:
+            np.add(Sigma, Sigma.T, out=out)
+        out *= 0.5
+        n_assets = out.shape[0]
+        trace = float(np.trace(out))
+        mu = trace / n_assets
+
+        if self.shrinkage is not None:
+            alpha = float(self.shrinkage)
+        else:
+            sq_norm = float(np.vdot(out, out))
+            # ||Sigma - mu I||_F^2 expanded so no centred copy is needed
+            d2 = max(sq_norm - trace * mu, 0.0)
+            n_samples = max(200, 5 * n_assets)
+            b2 = (sq_norm + trace ** 2) / n_samples
+            alpha = min(b2, d2) / d2 if d2 > 0 else 0.0
+
+        out *= 1.0 - alpha
+        # Target plus a small jitter to keep the result PSD
+        out.flat[:: n_assets + 1] += alpha * mu + 1e-10
+        return out
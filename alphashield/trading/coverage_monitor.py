@@ -1,15 +1,37 @@
 from __future__ import annotations
 
 import math
+from functools import lru_cache
 
+import numpy as np
 
+
+@lru_cache(maxsize=4096)
 def monthly_payment(principal: float, rate: float, term_months: int) -> float:
     if term_months <= 0:
         return 0.0
     r = rate / 12.0
     if abs(r) < 1e-12:
         return principal / term_months
-    return principal * (r * (1 + r) ** term_months) / ((1 + r) ** term_months - 1)
+    f = (1 + r) ** term_months
+    return principal * (r * f) / (f - 1)
+
+
+def monthly_payment_batch(principals, rates, term_months) -> np.ndarray:
+    """Array form of monthly_payment; inputs broadcast against each other."""
+    principals, rates, terms = np.broadcast_arrays(
+        np.asarray(principals, dtype=float),
+        np.asarray(rates, dtype=float) / 12.0,
+        np.asarray(term_months, dtype=float),
+    )
+    out = np.zeros(principals.shape)
+    zero_rate = np.abs(rates) < 1e-12
+    flat = (terms > 0) & zero_rate
+    np.divide(principals, terms, out=out, where=flat)
+    amort = (terms > 0) & ~zero_rate
+    f = np.power(1.0 + rates, terms, where=amort, out=np.ones(principals.shape))
+    np.divide(principals * rates * f, f - 1.0, out=out, where=amort)
+    return out
 
 
 def expected_monthly_return(nav: float, exp_return_assumption: float) -> float:
@@ -24,6 +46,16 @@ def coverage_ratio(nav: float, monthly_payment_amt: float, exp_return_assumption
     return float(exp_monthly / monthly_payment_amt)
 
 
+def coverage_ratio_batch(navs, monthly_payment_amts, exp_return_assumption: float = 0.10) -> np.ndarray:
+    """Array form of coverage_ratio; non-positive payments map to inf."""
+    navs, pmts = np.broadcast_arrays(
+        np.asarray(navs, dtype=float), np.asarray(monthly_payment_amts, dtype=float)
+    )
+    out = np.full(navs.shape, np.inf)
+    np.divide(navs * (float(exp_return_assumption) / 12.0), pmts, out=out, where=pmts > 0)
+    return out
+
+
 def is_coverage_ok(cr: float, target_ratio: float = 1.3, emergency_ratio: float = 1.2) -> bool:
     if cr < emergency_ratio:
         return False
@@ -1,6 +1,11 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import Tuple
+
+import numpy as np
+
+_STATUS_LABELS: Tuple[str, str, str] = ("emergency", "defensive", "normal")
 
 
 @dataclass
@@ -14,3 +19,10 @@ class CoverageRatioMonitor:
         if coverage_ratio < self.target_min:
             return "defensive"
         return "normal"
+
+    def status_batch(self, coverage_ratios: np.ndarray) -> np.ndarray:
+        """Status label for every ratio, with the same comparisons as status()."""
+        cr = np.asarray(coverage_ratios, dtype=float)
+        # NaN fails both comparisons and reads as "normal", as in status()
+        idx = np.where(cr < self.emergency_min, 0, np.where(cr < self.target_min, 1, 2))
+        return np.asarray(_STATUS_LABELS)[idx]
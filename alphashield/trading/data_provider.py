@@ -1,11 +1,24 @@
 from __future__ import annotations
 
+import hashlib
+import logging
+import os
+import time
 from dataclasses import dataclass
-from typing import Dict, List
+from functools import lru_cache
+from typing import Dict, List, Optional
 
 import numpy as np
 import pandas as pd
 
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=256)
+def _business_days(start: str, end: str) -> pd.DatetimeIndex:
+    # DatetimeIndex is immutable, so one instance can be shared across calls
+    return pd.bdate_range(start=start, end=end, freq="C")
+
 
 @dataclass
 class MarketData:
@@ -21,29 +34,66 @@ class DataProvider:
     For now, provides synthetic or stubbed data.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, cache_dir: Optional[str] = None, cache_ttl_days: float = 90.0) -> None:
         self._rng = np.random.default_rng(123)
+        # Optional on-disk cache of get_market_data results, one pickle per request
+        self.cache_dir = os.path.expanduser(cache_dir) if cache_dir else None
+        self.cache_ttl_seconds = float(cache_ttl_days) * 86400.0
 
     def get_historical_prices(self, tickers: List[str], start: str, end: str) -> pd.DataFrame:
-        dates = pd.bdate_range(start=start, end=end, freq="C")
+        dates = _business_days(start, end)
         n = len(dates)
         m = len(tickers)
         # Geometric Brownian Motion synthetic prices
         mu = 0.08 / 252
         sigma = 0.15 / np.sqrt(252)
-        shocks = self._rng.normal(mu, sigma, size=(n, m))
-        prices = 100 * np.exp(np.cumsum(shocks, axis=0))
+        # Draw, accumulate and exponentiate in float32, in place (synthetic data does not
+        # need double precision); widen once at the end so downstream stats stay float64
+        shocks = self._rng.standard_normal(size=(n, m), dtype=np.float32)
+        shocks *= np.float32(sigma)
+        shocks += np.float32(mu)
+        np.cumsum(shocks, axis=0, out=shocks)
+        np.exp(shocks, out=shocks)
+        prices = np.multiply(shocks, 100.0, dtype=np.float64)
         return pd.DataFrame(prices, index=dates, columns=tickers)
 
     def get_vix_series(self, start: str, end: str) -> pd.Series:
-        dates = pd.bdate_range(start=start, end=end, freq="C")
+        dates = _business_days(start, end)
         # Mean-reverting synthetic vol index
         vix = 20 + np.cumsum(self._rng.normal(0, 0.2, size=len(dates)))
         vix = np.clip(vix, 10, 60)
         return pd.Series(vix, index=dates, name="VIX")
 
     def get_market_data(self, tickers: List[str], start: str, end: str) -> MarketData:
+        path = self._cache_path(tickers, start, end)
+        if path is not None:
+            try:
+                if time.time() - os.path.getmtime(path) < self.cache_ttl_seconds:
+                    cached = pd.read_pickle(path)
+                    logger.debug("market data cache hit: %s", path)
+                    return MarketData(prices=cached["prices"], returns=cached["returns"], vix=cached["vix"])
+            except Exception:
+                # missing, unreadable or stale-format entry: refetch below
+                pass
+            logger.debug("market data cache miss: %s", path)
+
         prices = self.get_historical_prices(tickers, start, end)
         returns = prices.pct_change().dropna()
         vix = self.get_vix_series(start, end).reindex(prices.index).ffill()
-        return MarketData(prices=prices, returns=returns, vix=vix)
+        data = MarketData(prices=prices, returns=returns, vix=vix)
+
+        if path is not None:
+            try:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                tmp = f"{path}.{os.getpid()}.tmp"
+                pd.to_pickle({"prices": prices, "returns": returns, "vix": vix}, tmp)
+                os.replace(tmp, path)
+            except OSError as e:
+                logger.warning("could not write market data cache %s: %s", path, e)
+        return data
+
+    def _cache_path(self, tickers: List[str], start: str, end: str) -> Optional[str]:
+        if not self.cache_dir:
+            return None
+        key = hashlib.md5("|".join([",".join(tickers), str(start), str(end)]).encode()).hexdigest()
+        return os.path.join(self.cache_dir, f"market_{key}.pkl")
@@ -14,7 +14,25 @@ def _is_business_day_index(index: pd.Index) -> bool:
     # Consider business day index if frequency is business day or dates are weekdays
     if getattr(index, "freqstr", None) in {"B", "C"}:
         return True
-    return bool(pd.Index(index).to_series().dt.dayofweek.le(4).all())
+    return bool(np.all(np.asarray(index.dayofweek) <= 4))
+
+
+def _max_gap_bdays(df: pd.DataFrame) -> int:
+    """Longest run of business days in [min, max] of the index with no row or an all-NaN row."""
+    index = pd.DatetimeIndex(df.index)
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    days = index.values.astype("datetime64[D]")
+    start, end = days.min(), days.max() + 1
+    # Business-day rows that carry at least one value bound the gaps
+    observed = days[~df.isna().all(axis=1).to_numpy() & np.is_busday(days)]
+    if observed.size == 0:
+        return int(np.busday_count(start, end))
+    observed = np.unique(observed)
+    interior = np.busday_count(observed[:-1] + 1, observed[1:])
+    lead = np.busday_count(start, observed[0])
+    tail = np.busday_count(observed[-1] + 1, end)
+    return int(max(lead, tail, interior.max(initial=0)))
 
 
 def validate_prices(
@@ -46,26 +64,24 @@ def validate_prices(
     if len(df.index) < required_history:
         errors.append("insufficient_history")
 
-    # Identify gaps: reindex to full business day range and count consecutive NaNs
-    full_index = pd.bdate_range(df.index.min(), df.index.max())
-    reindexed = df.reindex(full_index)
-    # Forward fill small gaps to avoid cascading NaNs
-    ffilled = reindexed.ffill()
-    # Any stretch of NaNs longer than 5 indicates a gap
-    is_nan = reindexed.isna().all(axis=1)
-    if is_nan.any():
-        # compute longest consecutive run
-        groups = (is_nan != is_nan.shift()).cumsum()
-        max_run = int(is_nan.groupby(groups).transform("sum").where(is_nan).max() or 0)
-        if max_run > 5:
-            errors.append("gap_gt_5_bd")
+    # Identify gaps: longest run of business days with no data between observed rows
+    if _max_gap_bdays(df) > 5:
+        errors.append("gap_gt_5_bd")
+    arr = df.to_numpy(dtype=np.float64)
+    nan_mask = np.isnan(arr)
+
     # Non-positive prices
-    if (df <= 0).any().any():
+    if np.any(arr <= 0):
         errors.append("non_positive_price")
 
-    # Large daily moves (possible split)
-    returns = df.pct_change().replace([np.inf, -np.inf], np.nan)
-    if (returns.abs() > 0.5).any().any():
+    # Large daily moves (possible split), measured against the last available price
+    if nan_mask.any():
+        rows = np.where(nan_mask, 0, np.arange(arr.shape[0])[:, None])
+        np.maximum.accumulate(rows, axis=0, out=rows)
+        arr = arr[rows, np.arange(arr.shape[1])]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        moves = np.abs(arr[1:] / arr[:-1] - 1.0)
+    if np.any((moves > 0.5) & np.isfinite(moves)):
         errors.append("possible_split_or_corporate_action")
 
     ok = len(errors) == 0
@@ -81,25 +97,26 @@ def detect_outliers(returns: pd.Series, method: str = "iqr") -> pd.Series:
     Returns a boolean Series where True indicates an outlier.
     Supports 'iqr' and 'zscore'.
     """
-    x = pd.Series(returns).dropna()
-    if x.empty:
+    vals = pd.Series(returns).to_numpy(dtype=float)
+    x = vals[~np.isnan(vals)]
+    if x.size == 0:
         return pd.Series([], dtype=bool)
+    # NaN inputs compare False below, so they are never flagged
     if method == "iqr":
-        q1, q3 = x.quantile(0.25), x.quantile(0.75)
+        q1, q3 = np.percentile(x, [25, 75])
         iqr = q3 - q1
         lower, upper = q1 - 1.5 * iqr, q3 + 1.5 * iqr
-        mask = (x < lower) | (x > upper)
-        return mask.reindex(returns.index, fill_value=False)
+        mask = (vals < lower) | (vals > upper)
     elif method == "zscore":
-        mu, sigma = x.mean(), x.std(ddof=0)
+        mu, sigma = x.mean(), x.std()
         if sigma == 0:
-            mask = pd.Series(False, index=x.index)
+            mask = np.zeros(vals.shape, dtype=bool)
         else:
-            z = (x - mu) / sigma
-            mask = z.abs() > 3.0
-        return mask.reindex(returns.index, fill_value=False)
+            with np.errstate(invalid="ignore"):
+                mask = np.abs(vals - mu) / sigma > 3.0
     else:
         raise ValueError("method must be 'iqr' or 'zscore'")
+    return pd.Series(mask, index=returns.index)
 
 
 def check_liquidity(
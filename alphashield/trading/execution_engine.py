@@ -1,33 +1,81 @@
 from __future__ import annotations
 
-from typing import Dict
+import math
+import time
+from typing import Callable, Dict, List, Tuple
 
 import numpy as np
 
 
+class _TTLCache:
+    """Per-instance ticker -> value cache whose entries expire after ``ttl`` seconds."""
+
+    def __init__(self, ttl: float = 1.0) -> None:
+        self.ttl = ttl
+        self._entries: Dict[str, Tuple[float, float]] = {}
+
+    def get_many(self, keys: List[str], fetch: Callable[[List[str]], np.ndarray]) -> np.ndarray:
+        now = time.monotonic()
+        out = np.empty(len(keys))
+        missing: List[int] = []
+        for i, key in enumerate(keys):
+            hit = self._entries.get(key)
+            if hit is not None and now - hit[1] < self.ttl:
+                out[i] = hit[0]
+            else:
+                missing.append(i)
+        if missing:
+            # Only the stale/unknown keys go to the data source, in one batched call
+            fetched = np.asarray(fetch([keys[i] for i in missing]), dtype=float)
+            out[missing] = fetched
+            for i, value in zip(missing, fetched.tolist(), strict=True):
+                self._entries[keys[i]] = (value, now)
+        return out
+
+
 class SlippageModel:
     """Estimate transaction costs and slippage based on order size and volume."""
 
+    def __init__(self, cache_ttl: float = 1.0) -> None:
+        self._volume_cache = _TTLCache(cache_ttl)
+
     def estimate(self, ticker: str, quantity: float) -> float:
         avg_daily_volume = self._get_avg_volume(ticker)
         if avg_daily_volume <= 0:
             return 0.005  # 50 bps default
         impact_ratio = float(quantity) / float(avg_daily_volume)
         base_slippage = 0.001  # 10 bps
-        slippage = base_slippage * np.sqrt(max(impact_ratio * 100.0, 0.0))
-        return float(min(slippage, 0.01))  # Cap at 100 bps
+        # Scalar math: math.sqrt avoids NumPy's ufunc dispatch on a single float
+        slippage = base_slippage * math.sqrt(max(impact_ratio * 100.0, 0.0))
+        return min(slippage, 0.01)  # Cap at 100 bps
+
+    def estimate_batch(self, tickers: List[str], quantities: np.ndarray) -> np.ndarray:
+        """Vectorized estimate() for many orders; quantities are absolute share counts."""
+        adv = self._get_avg_volumes(tickers)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            impact_ratio = np.asarray(quantities, dtype=float) / adv
+        slippage = np.minimum(0.001 * np.sqrt(np.maximum(impact_ratio * 100.0, 0.0)), 0.01)
+        return np.where(adv <= 0, 0.005, slippage)
 
     def _get_avg_volume(self, ticker: str) -> float:
+        return float(self._get_avg_volumes([ticker])[0])
+
+    def _get_avg_volumes(self, tickers: List[str]) -> np.ndarray:
+        return self._volume_cache.get_many(tickers, self._fetch_avg_volumes)
+
+    def _fetch_avg_volumes(self, tickers: List[str]) -> np.ndarray:
         # Placeholder: to be connected to data provider
-        return 1_000_000.0
+        return np.full(len(tickers), 1_000_000.0)
 
 
 class ExecutionEngine:
     """Handle order routing and execution with a broker API."""
 
-    def __init__(self, broker_api) -> None:
+    def __init__(self, broker_api, cache_ttl: float = 1.0) -> None:
         self.broker = broker_api
-        self.slippage_model = SlippageModel()
+        self.slippage_model = SlippageModel(cache_ttl)
+        # Quotes are reused for cache_ttl seconds, so one rebalance fetches each ticker once
+        self._price_cache = _TTLCache(cache_ttl)
 
     def execute_rebalance(
         self,
@@ -37,34 +85,28 @@ class ExecutionEngine:
     ) -> Dict[str, dict]:
         trades = self._calculate_trades(current_positions, target_weights, total_value)
         confirmations: Dict[str, dict] = {}
-
-        # Sells first
-        for ticker, quantity in trades.items():
-            if quantity < 0:
-                estimated_slippage = self.slippage_model.estimate(ticker, abs(quantity))
-                limit_price = self._get_conservative_limit_price(ticker, "sell", estimated_slippage)
-                confirmation = self.broker.submit_order(
-                    ticker=ticker,
-                    qty=int(abs(quantity)),
-                    side="sell",
-                    type="limit",
-                    limit_price=limit_price,
-                )
-                confirmations[ticker] = confirmation
-
-        # Buys after
-        for ticker, quantity in trades.items():
-            if quantity > 0:
-                estimated_slippage = self.slippage_model.estimate(ticker, quantity)
-                limit_price = self._get_conservative_limit_price(ticker, "buy", estimated_slippage)
-                confirmation = self.broker.submit_order(
-                    ticker=ticker,
-                    qty=int(quantity),
-                    side="buy",
-                    type="limit",
-                    limit_price=limit_price,
-                )
-                confirmations[ticker] = confirmation
+        if not trades:
+            return confirmations
+
+        tickers = list(trades)
+        qtys = np.array([trades[t] for t in tickers], dtype=float)
+        # One batched price/volume lookup for all orders instead of per-order calls
+        prices = self._get_prices(tickers)
+        slippage = self.slippage_model.estimate_batch(tickers, np.abs(qtys))
+        limit_prices = np.where(qtys > 0, prices * (1.0 + slippage), prices * (1.0 - slippage))
+
+        # Sells first, then buys; stable sort keeps the original order within each side
+        for i in np.argsort(np.sign(qtys), kind="stable").tolist():
+            if qtys[i] == 0:
+                continue
+            side = "sell" if qtys[i] < 0 else "buy"
+            confirmations[tickers[i]] = self.broker.submit_order(
+                ticker=tickers[i],
+                qty=int(abs(qtys[i])),
+                side=side,
+                type="limit",
+                limit_price=float(limit_prices[i]),
+            )
 
         return confirmations
 
@@ -74,18 +116,16 @@ class ExecutionEngine:
         target_weights: Dict[str, float],
         total_value: float,
     ) -> Dict[str, int]:
-        trades: Dict[str, int] = {}
-        tickers = set(current_positions.keys()) | set(target_weights.keys())
-        for ticker in tickers:
-            current_qty = float(current_positions.get(ticker, 0.0))
-            price = self._get_price(ticker)
-            current_value = current_qty * price
-            target_value = float(target_weights.get(ticker, 0.0)) * float(total_value)
-            delta_value = target_value - current_value
-            delta_shares = delta_value / max(price, 1e-6)
-            if abs(delta_shares) > 1.0:
-                trades[ticker] = int(round(delta_shares))
-        return trades
+        tickers = sorted(set(current_positions) | set(target_weights))
+        if not tickers:
+            return {}
+        prices = self._get_prices(tickers)
+        current_qty = np.array([float(current_positions.get(t, 0.0)) for t in tickers])
+        target_w = np.array([float(target_weights.get(t, 0.0)) for t in tickers])
+        delta_shares = (target_w * float(total_value) - current_qty * prices) / np.maximum(prices, 1e-6)
+        mask = np.abs(delta_shares) > 1.0
+        traded = np.asarray(tickers)[mask].tolist()
+        return dict(zip(traded, np.rint(delta_shares[mask]).astype(int).tolist(), strict=True))
 
     def _get_conservative_limit_price(self, ticker: str, side: str, slippage: float) -> float:
         price = self._get_price(ticker)
@@ -95,5 +135,11 @@ class ExecutionEngine:
             return price * (1.0 - slippage)
 
     def _get_price(self, ticker: str) -> float:
-        # Placeholder for data provider integration
-        return 100.0
+        return float(self._get_prices([ticker])[0])
+
+    def _get_prices(self, tickers: List[str]) -> np.ndarray:
+        return self._price_cache.get_many(tickers, self._fetch_prices)
+
+    def _fetch_prices(self, tickers: List[str]) -> np.ndarray:
+        # Placeholder for data provider integration (one batched lookup per rebalance)
+        return np.full(len(tickers), 100.0)
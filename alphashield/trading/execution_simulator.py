@@ -1,10 +1,17 @@
 from __future__ import annotations
 
-from typing import Dict, Tuple
+from typing import Dict, Sequence, Tuple
 import pandas as pd
 import numpy as np
 
 
+def half_spreads(tickers: Sequence[str], spread_bps: dict[str, float] | None = None) -> np.ndarray:
+    """Per-name half-spread as a fraction, aligned to tickers (1bp full spread by default)."""
+    if spread_bps is None:
+        return np.full(len(tickers), 1.0 * 1e-4 / 2.0)
+    return np.array([float(spread_bps.get(t, 1.0)) for t in tickers]) * 1e-4 / 2.0
+
+
 def simulate_execution(
     current_weights: pd.Series,
     target_weights: pd.Series,
@@ -23,46 +30,74 @@ def simulate_execution(
     Returns dict with trades, total_cost, final_weights, final_value
     """
     idx = target_weights.index
-    cw = current_weights.reindex(idx).fillna(0.0)
-    tw = target_weights.reindex(idx).fillna(0.0)
-    delta_w = tw - cw
+    cw = current_weights.reindex(idx).fillna(0.0).to_numpy(dtype=float)
+    tw = target_weights.reindex(idx).fillna(0.0).to_numpy(dtype=float)
+    px = prices.reindex(idx).to_numpy(dtype=float)
+    if adv is not None:
+        # Missing/NaN ADV means no cap, as before
+        cap = adv.reindex(idx).to_numpy(dtype=float) * adv_limit
+        cap = np.where(np.isnan(cap), np.inf, cap)
+    else:
+        cap = None
+    res = simulate_execution_arrays(
+        cw, tw, px, idx, half_spreads(idx, spread_bps), cap, commission_per_trade, portfolio_value
+    )
+    res["final_weights"] = pd.Series(res["final_weights"], index=idx)
+    return res
 
-    if spread_bps is None:
-        spread_bps = {t: 1.0 for t in idx}
+
+def simulate_execution_arrays(
+    current_weights: np.ndarray,
+    target_weights: np.ndarray,
+    prices: np.ndarray,
+    tickers: Sequence[str],
+    half_spread: np.ndarray,
+    trade_cap: np.ndarray | None = None,
+    commission_per_trade: float = 0.0,
+    portfolio_value: float = 0.0,
+) -> dict:
+    """
+    simulate_execution on positionally aligned arrays: every array is indexed like
+    `tickers`, half_spread comes from half_spreads() and trade_cap is the per-name
+    notional cap (None for no cap). final_weights is returned as an ndarray.
+    """
+    cw = current_weights
+    delta_w = target_weights - cw
+    px = prices
+    tradable = np.isfinite(px) & (px > 0) & (delta_w != 0.0)
 
     traded_value = {}
     total_cost = 0.0
     new_weights = cw.copy()
     total_value = float(portfolio_value)
 
-    for t in idx:
-        desired_notional = float(delta_w[t]) * total_value
+    # Costs reduce total_value trade by trade and later trades are sized off the reduced
+    # value (with an ADV min), so only this scalar recurrence stays sequential
+    dw_l, cw_l, hsp_l = delta_w.tolist(), cw.tolist(), half_spread.tolist()
+    cap_l = trade_cap.tolist() if trade_cap is not None else None
+    for i in np.flatnonzero(tradable).tolist():
+        desired_notional = dw_l[i] * total_value
         if desired_notional == 0.0:
             continue
-        price = float(prices.get(t, np.nan))
-        if not np.isfinite(price) or price <= 0:
-            continue
-        max_trade = abs(desired_notional)
-        if adv is not None and t in adv.index:
-            max_trade = min(max_trade, float(adv[t]) * adv_limit)
-        executed = np.sign(desired_notional) * max_trade
+        max_trade = abs(desired_notional) if cap_l is None else min(abs(desired_notional), cap_l[i])
+        executed = max_trade if desired_notional > 0 else -max_trade
         # apply slippage cost
-        hsp = float(spread_bps.get(t, 1.0)) * 1e-4 / 2.0
-        slippage = abs(executed) * hsp
+        slippage = abs(executed) * hsp_l[i]
         commission = commission_per_trade if abs(executed) > 0 else 0.0
         total_cost += slippage + commission
 
-        traded_value[t] = executed
+        traded_value[tickers[i]] = executed
         # update weight approximation
         total_value_after = total_value - slippage - commission
-        new_notional = float(cw[t]) * total_value_after + executed
+        new_notional = cw_l[i] * total_value_after + executed
         total_value = total_value_after
-        new_weights[t] = new_notional / max(total_value, 1e-9)
+        new_weights[i] = new_notional / max(total_value, 1e-9)
 
-    final_weights = new_weights.clip(0.0, 1.0)
+    final_weights = np.clip(new_weights, 0.0, 1.0, out=new_weights)
     # renormalize to sum to 1
-    if final_weights.sum() > 0:
-        final_weights = final_weights / final_weights.sum()
+    total_w = final_weights.sum()
+    if total_w > 0:
+        final_weights /= total_w
 
     return {
         "trades": traded_value,
@@ -1,15 +1,48 @@
 from __future__ import annotations
 
-from typing import Dict, List, Tuple
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass, fields
+from types import MappingProxyType
+from typing import Any, List, Tuple
 
 
-def default_constraints() -> Dict:
+@dataclass(frozen=True, slots=True, eq=False)
+class Constraints(Mapping):
+    """Portfolio constraints used by optimizers.
+
+    Immutable; derive adjusted constraints with ``dataclasses.replace(...)``. Reads the
+    same as the dict it replaces: keys, ``in``, iteration, ``**cons`` and equality with a
+    dict all follow mapping semantics. Use default_constraints() for the defaults.
+    """
+
+    risk_aversion: float
+    max_weight: float
+    max_turnover: float
+    sector_limits: Mapping[str, Tuple[List[int], float]]
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in _FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(_FIELDS)
+
+    def __len__(self) -> int:
+        return len(_FIELDS)
+
+
+_FIELDS: Tuple[str, ...] = tuple(f.name for f in fields(Constraints))
+
+
+def default_constraints() -> Constraints:
     """Default portfolio constraints used by optimizers."""
-    # Example sector limits mapping
-    sector_limits: Dict[str, Tuple[List[int], float]] = {}
-    return {
-        "risk_aversion": 1.0,
-        "max_weight": 0.20,
-        "max_turnover": 0.30,
-        "sector_limits": sector_limits,
-    }
+    # Example sector limits mapping; read-only so the constraints stay immutable
+    sector_limits: Mapping[str, Tuple[List[int], float]] = MappingProxyType({})
+    return Constraints(
+        risk_aversion=1.0,
+        max_weight=0.20,
+        max_turnover=0.30,
+        sector_limits=sector_limits,
+    )
+
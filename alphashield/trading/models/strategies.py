@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from typing import Dict
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StrategyProfile:
     name: str
     momentum_weight: float
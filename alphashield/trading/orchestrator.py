@@ -1,17 +1,48 @@
 from __future__ import annotations
 
-import json
-from typing import Any, Dict, List, Optional
+import logging
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
 
-from alphashield.utils.logging_config import get_logger
+from alphashield.utils.logging_config import get_logger, json_dumps
 from alphashield.utils.metrics import time_block, decisions_inc
 from alphashield.trading.coverage_monitor import monthly_payment, coverage_ratio as compute_cr, is_coverage_ok
 from alphashield.trading.portfolio_optimizer import PortfolioOptimizer, OptimizerConfig
-from alphashield.trading.signal_generator import momentum_signal, trend_sma200_signal, mean_reversion_signal, combine_signals
-from alphashield.trading.execution_simulator import simulate_execution
+from alphashield.trading.signal_generator import combined_signal, signal_to_expected_return
+from alphashield.trading.execution_simulator import half_spreads, simulate_execution, simulate_execution_arrays
+
+_SQRT252 = float(np.sqrt(252.0))
+
+
+def _daily_returns(prices: pd.DataFrame) -> Tuple[np.ndarray, pd.Index]:
+    """
+    prices.pct_change().dropna() as (values, index), computed on the raw array without
+    building the intermediate or result DataFrames.
+    """
+    p = prices.to_numpy(dtype=np.float64)
+    if np.isnan(p).any():
+        # pct_change pads missing prices before differencing
+        p = prices.ffill().to_numpy(dtype=np.float64)
+    r = np.empty((max(p.shape[0] - 1, 0), p.shape[1]), dtype=np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        np.divide(p[1:], p[:-1], out=r)
+    r -= 1.0
+    keep = ~np.isnan(r).any(axis=1)
+    if not keep.all():
+        return r[keep], prices.index[1:][keep]
+    return r, prices.index[1:]
+
+
+def _mean_column_vol(returns: np.ndarray) -> float:
+    """returns.std().mean() of the DataFrame form, in one NumPy reduction per step."""
+    if returns.shape[0] < 2:
+        return float("nan")
+    with np.errstate(invalid="ignore", divide="ignore"):
+        std = returns.std(axis=0, ddof=1)
+    std = std[~np.isnan(std)]
+    return float(std.mean()) if std.size else float("nan")
 
 
 class TradingOrchestrator:
@@ -34,6 +65,11 @@ class TradingOrchestrator:
             )
         )
         self.current_weights: Optional[pd.Series] = None
+        # (columns, index, values) of the returns window held in the optimizer's running
+        # covariance moments
+        self._returns_seen: Optional[Tuple[tuple, pd.Index, np.ndarray]] = None
+        self._zero_weights_cache: Optional[pd.Series] = None
+        self._half_spread_cache: Optional[Tuple[pd.Index, np.ndarray]] = None
 
     def step(
         self,
@@ -51,21 +87,25 @@ class TradingOrchestrator:
         weights_cfg = sig_cfg.get("weights", {"momentum": 0.5, "trend": 0.3, "meanrev": 0.2})
 
         with time_block("signals"):
-            mom = momentum_signal(prices_window, window_6m=mom_w // 2, window_12m=mom_w)
-            tr = trend_sma200_signal(prices_window, window=tr_w)
-            mr = mean_reversion_signal(prices_window, window=mr_w)
-            combined = combine_signals({"momentum": mom, "trend": tr, "meanrev": mr}, weights_cfg)
+            combined = combined_signal(
+                prices_window,
+                window_6m=mom_w // 2,
+                window_12m=mom_w,
+                trend_window=tr_w,
+                meanrev_window=mr_w,
+                weights=weights_cfg,
+            )
 
-        mu = (combined - 0.5) * 0.20
-        returns = prices_window.pct_change().dropna()
+        mu = signal_to_expected_return(combined)
+        returns, returns_index = _daily_returns(prices_window)
+
+        with time_block("optimize"):
+            target_weights, _ = self._optimize(mu, returns, returns_index, prices_window.columns)
 
         # Template selection heuristic: defensive if realized vol high
-        realized_vol = float(returns.std().mean() * np.sqrt(252)) if not returns.empty else 0.0
+        realized_vol = self._realized_vol(returns) * _SQRT252 if returns.size else 0.0
         template_name = "risk_off" if realized_vol > 0.20 else "balanced"
 
-        with time_block("optimize"):
-            target_weights, _ = self.optimizer.optimize(mu, returns)
-
         # Coverage
         cov_cfg = self.config.get("coverage", {})
         exp_ret = float(cov_cfg.get("exp_return_assumption", 0.10))
@@ -80,26 +120,48 @@ class TradingOrchestrator:
         spread_bps = exec_cfg.get("spread_bps", {})
         commission = float(exec_cfg.get("commission_per_trade", 0.0))
         adv_limit = float(exec_cfg.get("adv_limit", 0.10))
-        prices_row = prices_window.iloc[-1]
-        current_weights = self.current_weights or pd.Series(0.0, index=prices_window.columns)
+        cols = prices_window.columns
+        if self.current_weights is not None:
+            current_weights = self.current_weights
+        else:
+            current_weights = self._zero_weights(cols)
 
         with time_block("execution"):
-            execution = simulate_execution(
-                current_weights=current_weights,
-                target_weights=target_weights,
-                prices=prices_row,
-                adv=None,
-                spread_bps=spread_bps,
-                commission_per_trade=commission,
-                adv_limit=adv_limit,
-                portfolio_value=float(portfolio_value),
-            )
-        self.current_weights = execution["final_weights"].reindex(prices_window.columns).fillna(0.0)
+            if target_weights.index.equals(cols) and current_weights.index.equals(cols):
+                # Everything is already aligned to the window's columns: run on raw arrays
+                # and wrap the final weights in a Series once, for the payload
+                current_arr = current_weights.to_numpy(dtype=float)
+                execution = simulate_execution_arrays(
+                    current_arr,
+                    target_weights.to_numpy(dtype=float),
+                    prices_window.to_numpy(dtype=float)[-1],
+                    cols,
+                    self._half_spreads(cols, spread_bps),
+                    commission_per_trade=commission,
+                    portfolio_value=float(portfolio_value),
+                )
+                final_arr = execution["final_weights"]
+                turnover = float(np.abs(final_arr - current_arr).sum())
+                execution["final_weights"] = pd.Series(final_arr, index=cols)
+                self.current_weights = execution["final_weights"]
+            else:
+                execution = simulate_execution(
+                    current_weights=current_weights,
+                    target_weights=target_weights,
+                    prices=prices_window.iloc[-1],
+                    adv=None,
+                    spread_bps=spread_bps,
+                    commission_per_trade=commission,
+                    adv_limit=adv_limit,
+                    portfolio_value=float(portfolio_value),
+                )
+                self.current_weights = execution["final_weights"].reindex(cols).fillna(0.0)
+                turnover = float(abs(self.current_weights - current_weights).sum())
         final_value = float(execution["final_value"]) if isinstance(execution.get("final_value"), (float, int)) else float(portfolio_value)
 
         risk_metrics = {
             "realized_vol": realized_vol,
-            "turnover": float(abs(self.current_weights - current_weights).sum()),
+            "turnover": turnover,
         }
 
         rationale: List[str] = []
@@ -107,18 +169,26 @@ class TradingOrchestrator:
         rationale.append(f"realized_vol={realized_vol:.2f}")
         rationale.append(f"coverage_ratio={cr:.2f}")
 
-        log = {
-            "event": "trading_decision",
-            "date": str(date),
-            "loan_id": loan_id,
-            "coverage_ratio": float(cr),
-            "template": template_name,
-            "weights": {k: float(v) for k, v in target_weights.to_dict().items()},
-            "costs": float(execution.get("total_cost", 0.0)),
-            "metrics": risk_metrics,
-        }
         try:
-            self.logger.info(json.dumps(log))
+            # Build and encode the decision record only when INFO is actually emitted
+            if self.logger.isEnabledFor(logging.INFO):
+                log = {
+                    "event": "trading_decision",
+                    "date": str(date),
+                    "loan_id": loan_id,
+                    "coverage_ratio": float(cr),
+                    "template": template_name,
+                    "weights": dict(
+                        zip(
+                            target_weights.index,
+                            target_weights.to_numpy(dtype=float).tolist(),
+                            strict=True,
+                        )
+                    ),
+                    "costs": float(execution.get("total_cost", 0.0)),
+                    "metrics": risk_metrics,
+                }
+                self.logger.info(json_dumps(log))
             decisions_inc(template_name)
         except Exception:
             pass
@@ -131,3 +201,77 @@ class TradingOrchestrator:
             "rationale": rationale,
             "final_value": final_value,
         }
+
+    def _zero_weights(self, columns: pd.Index) -> pd.Series:
+        """All-cash starting weights, reused while the universe is unchanged (read-only)."""
+        zw = self._zero_weights_cache
+        if zw is None or not zw.index.equals(columns):
+            zw = pd.Series(np.zeros(len(columns)), index=columns)
+            self._zero_weights_cache = zw
+        return zw
+
+    def _half_spreads(self, columns: pd.Index, spread_bps: Dict[str, float]) -> np.ndarray:
+        """Configured half-spreads aligned to the universe, rebuilt only when it changes."""
+        cached = self._half_spread_cache
+        if cached is None or not cached[0].equals(columns):
+            cached = (columns, half_spreads(columns, spread_bps))
+            self._half_spread_cache = cached
+        return cached[1]
+
+    def _optimize(
+        self, mu: pd.Series, x: np.ndarray, idx: pd.Index, columns: pd.Index
+    ) -> Tuple[pd.Series, dict]:
+        """
+        optimizer.optimize(mu, returns) for the returns frame (x, idx, columns), reusing
+        covariance work across steps: when this step's window overlaps the last one (same
+        columns, starts inside it, shared rows unchanged), only rows that entered or left
+        the window touch the running moments.
+        """
+        if not mu.index.equals(columns):
+            self._returns_seen = None
+            return self.optimizer.optimize(mu, pd.DataFrame(x, index=idx, columns=columns))
+        if x.size == 0:
+            self._returns_seen = None
+            tickers = list(columns)
+            w, info = self.optimizer.optimize_arrays(mu.to_numpy(dtype=float), x, tickers)
+            return pd.Series(w, index=tickers), info
+        cols = tuple(columns)
+        offset = self._window_offset(cols, idx, x)
+        if offset is None:
+            self.optimizer.reset_streaming()
+            self.optimizer.fold_returns(x)
+        else:
+            prev = self._returns_seen[2]
+            shared = len(prev) - offset
+            self.optimizer.fold_returns(x[shared:], dropped=prev[:offset], window=x)
+        self._returns_seen = (cols, idx, x)
+        return self.optimizer.optimize_folded(mu)
+
+    def _realized_vol(self, returns: np.ndarray) -> float:
+        """
+        Mean daily column volatility of this step's returns. When _optimize streamed the
+        window, the running moments already hold it and the window is not rescanned.
+        """
+        if self._returns_seen is not None:
+            std = self.optimizer.folded_column_std()
+            if std is not None:
+                return float(std.mean())
+        return _mean_column_vol(returns)
+
+    def _window_offset(self, cols: tuple, idx: pd.Index, x: np.ndarray) -> Optional[int]:
+        """Rows the previous window must drop to line up with this one, or None."""
+        seen = self._returns_seen
+        if seen is None or seen[0] != cols or not seen[1].is_monotonic_increasing:
+            return None
+        prev_idx, prev = seen[1], seen[2]
+        offset = int(prev_idx.searchsorted(idx[0]))
+        if offset >= len(prev_idx) or prev_idx[offset] != idx[0]:
+            return None
+        shared = len(prev_idx) - offset
+        if len(idx) < shared or not idx[:shared].equals(prev_idx[offset:]):
+            return None
+        # The whole overlap must be unchanged: a revision anywhere inside it would leave
+        # stale rows in the running moments, so any difference forces a fresh estimate
+        if not np.array_equal(x[:shared], prev[offset:]):
+            return None
+        return offset
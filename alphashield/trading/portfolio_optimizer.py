@@ -1,14 +1,15 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, Tuple
+from typing import Dict, Sequence, Tuple
 
 import numpy as np
 import pandas as pd
+from scipy.linalg import cho_factor, cho_solve
 try:
-    from sklearn.covariance import LedoitWolf  # type: ignore
+    from sklearn.covariance import ledoit_wolf  # type: ignore
 except Exception:
-    LedoitWolf = None  # type: ignore
+    ledoit_wolf = None  # type: ignore
 
 from alphashield.utils.errors import OptimizationError
 
@@ -21,50 +22,208 @@ class OptimizerConfig:
     risk_aversion: float = 1.0
     max_position: float = 0.5
     min_return: float = 0.0
+    covariance_dtype: str = "float64"     # or "float32": halves estimator bandwidth, ~1e-7 rel. error
+    ledoit_wolf_impl: str = "numpy"       # or "sklearn" (falls back to numpy when not installed)
 
 
 def _project_to_simplex_box(w: np.ndarray, max_pos: float) -> np.ndarray:
-    w = np.clip(w, 0.0, max_pos)
+    """Clip to [0, max_pos] and renormalize, in place: `w` must be a scratch array."""
+    np.maximum(w, 0.0, out=w)
+    np.minimum(w, max_pos, out=w)
     s = w.sum()
     if s <= 0:
         # fallback: equal weight within box
         n = w.shape[0]
         return np.full(n, min(1.0 / n, max_pos))
-    return w / s
+    w /= s
+    return w
 
 
-def _estimate_covariance(returns: pd.DataFrame, method: str, ewma_lambda: float) -> np.ndarray:
-    x = returns.dropna()
+def _demean(x: np.ndarray, out: np.ndarray | None = None) -> np.ndarray:
+    """x minus its column means, written into `out` when it matches x's shape and dtype."""
+    if out is None or out.shape != x.shape or out.dtype != x.dtype:
+        out = None
+    return np.subtract(x, x.mean(axis=0), out=out)
+
+
+def _ledoit_wolf_fast(x: np.ndarray, scratch: np.ndarray | None = None) -> np.ndarray:
+    """
+    Ledoit-Wolf shrunk covariance of the rows of x, the same estimate as
+    sklearn.covariance.ledoit_wolf, from one GEMM and row norms.
+    """
+    n, p = x.shape
+    xc = _demean(x, scratch)
+    emp = (xc.T @ xc) / n
+    if p == 1:
+        return emp
+    trace = float(np.trace(emp))
+    mu = trace / p
+    row_sq = np.einsum("ij,ij->i", xc, xc)
+    # sum_k ||x_k x_k^T||_F^2 = sum_k ||x_k||^4, so the fourth-moment term needs no GEMM
+    beta_ = float(row_sq @ row_sq)
+    delta_ = float(np.sum(emp ** 2))
+    beta = (beta_ / n - delta_) / (p * n)
+    delta = (delta_ - 2.0 * mu * trace + p * mu ** 2) / p
+    beta = min(beta, delta)
+    shrinkage = 0.0 if beta == 0 else beta / delta
+    cov = (1.0 - shrinkage) * emp
+    cov.flat[:: p + 1] += shrinkage * mu
+    return cov
+
+
+def _estimate_covariance(
+    returns: pd.DataFrame | np.ndarray,
+    method: str,
+    ewma_lambda: float,
+    dtype: str = "float64",
+    ledoit_wolf_impl: str = "numpy",
+    scratch: np.ndarray | None = None,
+) -> np.ndarray:
+    # One contiguous block; everything below is plain NumPy/BLAS on it. The estimate is
+    # computed in `dtype` but always returned as float64 for the solver. `scratch`, if it
+    # has the NaN-free block's shape and dtype, receives the demeaned rows
+    if isinstance(returns, pd.DataFrame):
+        returns = returns.to_numpy(dtype=np.dtype(dtype))
+    x = np.asarray(returns, dtype=np.dtype(dtype))
+    rows_with_nan = np.isnan(x).any(axis=1)
+    if rows_with_nan.any():
+        x = x[~rows_with_nan]
+    x = np.ascontiguousarray(x)
     if x.shape[0] < 2:
-        # tiny sample; diagonal proxy
-        v = x.var().fillna(1e-4).to_numpy(dtype=float)
-        return np.diag(np.maximum(v, 1e-6))
+        # tiny sample; diagonal proxy (sample variance is undefined, use the 1e-4 floor)
+        return np.diag(np.full(x.shape[1], 1e-4))
     if method == "ledoit_wolf":
-        if LedoitWolf is None:
-            # fallback to sample covariance
-            return x.cov().to_numpy(dtype=float)
-        lw = LedoitWolf().fit(x.to_numpy(dtype=float))
-        return lw.covariance_
+        if ledoit_wolf_impl == "sklearn" and ledoit_wolf is not None:
+            cov, _ = ledoit_wolf(x, block_size=1000)
+            return cov.astype(np.float64, copy=False)
+        return _ledoit_wolf_fast(x, scratch).astype(np.float64, copy=False)
     elif method == "ewma":
         lam = float(ewma_lambda)
-        demeaned = x - x.mean()
-        cov = np.zeros((x.shape[1], x.shape[1]))
-        weight = 1.0
-        total = 0.0
-        for i in range(len(demeaned) - 1, -1, -1):
-            v = demeaned.iloc[i].to_numpy(dtype=float).reshape(-1, 1)
-            cov += weight * (v @ v.T)
-            total += weight
-            weight *= lam
-        cov = cov / max(total, 1e-12)
-        return cov
+        demeaned = _demean(x, scratch)
+        # Newest row weighted 1, each older row by a further factor lam: one weighted GEMM
+        weights = np.power(lam, np.arange(x.shape[0] - 1, -1, -1, dtype=np.float64))
+        total = float(weights.sum())
+        cov = (demeaned.T * weights.astype(x.dtype, copy=False)) @ demeaned
+        cov /= max(total, 1e-12)
+        return cov.astype(np.float64, copy=False)
     else:
         raise ValueError("unknown covariance method")
 
 
+# Downdates allowed before the running moments are rebuilt from the raw window
+_RESEED_EVERY = 500
+
+
+class _CovarianceMoments:
+    """Running raw moments of a return window.
+
+    Holds enough sums to rebuild the Ledoit-Wolf, sample and EWMA estimates of
+    _estimate_covariance exactly, so a growing or sliding window is maintained in
+    O(changed_rows * K^2) instead of being rescanned on every call.
+    """
+
+    def __init__(self, n_assets: int, ewma_lambda: float):
+        self.lam = float(ewma_lambda)
+        self.n = 0
+        self.s1 = np.zeros(n_assets)                # sum x
+        self.s2 = np.zeros((n_assets, n_assets))    # sum x x^T
+        self.q2 = 0.0                               # sum |x|^4
+        self.qx = np.zeros(n_assets)                # sum |x|^2 x
+        self.ew_w = 0.0                             # EWMA weight total (newest row has weight 1)
+        self.ew_s1 = np.zeros(n_assets)
+        self.ew_s2 = np.zeros((n_assets, n_assets))
+        self.downdates = 0
+
+    def update(self, rows: np.ndarray) -> None:
+        m = rows.shape[0]
+        if m == 0:
+            return
+        sq = np.einsum("ij,ij->i", rows, rows)
+        self.n += m
+        self.s1 += rows.sum(axis=0)
+        self.s2 += rows.T @ rows
+        self.q2 += float(sq @ sq)
+        self.qx += sq @ rows
+        decay = self.lam ** np.arange(m - 1, -1, -1, dtype=float)
+        scale = self.lam ** m
+        self.ew_w = self.ew_w * scale + float(decay.sum())
+        self.ew_s1 = self.ew_s1 * scale + decay @ rows
+        self.ew_s2 = self.ew_s2 * scale + (rows * decay[:, None]).T @ rows
+
+    def column_std(self, ddof: int = 1) -> np.ndarray:
+        """Per-column standard deviation of the window, from the diagonal of the sums."""
+        n = self.n
+        var = (np.diagonal(self.s2) - self.s1 * self.s1 / n) / (n - ddof)
+        return np.sqrt(np.maximum(var, 0.0))
+
+    def drop(self, rows: np.ndarray) -> None:
+        """Remove the oldest rows of the window (given oldest first)."""
+        m = rows.shape[0]
+        if m == 0:
+            return
+        sq = np.einsum("ij,ij->i", rows, rows)
+        # EWMA weight of a row is lam ** (rows newer than it)
+        age = self.lam ** np.arange(self.n - 1, self.n - 1 - m, -1, dtype=float)
+        self.n -= m
+        self.s1 -= rows.sum(axis=0)
+        self.s2 -= rows.T @ rows
+        self.q2 -= float(sq @ sq)
+        self.qx -= sq @ rows
+        self.ew_w -= float(age.sum())
+        self.ew_s1 -= age @ rows
+        self.ew_s2 -= (rows * age[:, None]).T @ rows
+        self.downdates += 1
+
+    def covariance(self, method: str) -> np.ndarray:
+        n = self.n
+        mean = self.s1 / n
+        if method == "ledoit_wolf":
+            emp = self.s2 / n - np.outer(mean, mean)
+            # Same shrinkage as _ledoit_wolf_fast, with the centred fourth-moment term
+            # sum_i |x_i - mean|^4 expanded into the running sums
+            p = emp.shape[0]
+            if p == 1:
+                return emp
+            c = float(mean @ mean)
+            trace_s2 = float(np.trace(self.s2))
+            beta_ = (
+                self.q2
+                + 4.0 * float(mean @ self.s2 @ mean)
+                + n * c * c
+                - 4.0 * float(mean @ self.qx)
+                + 2.0 * c * trace_s2
+                - 4.0 * c * float(mean @ self.s1)
+            )
+            trace = float(np.trace(emp))
+            mu = trace / p
+            delta_ = float(np.sum(emp ** 2))
+            beta = (beta_ / n - delta_) / (p * n)
+            delta = (delta_ - 2.0 * mu * trace + p * mu ** 2) / p
+            beta = min(beta, delta)
+            shrinkage = 0.0 if beta == 0 else beta / delta
+            cov = (1.0 - shrinkage) * emp
+            cov.flat[:: p + 1] += shrinkage * mu
+            return cov
+        elif method == "ewma":
+            w = self.ew_w
+            cross = np.outer(self.ew_s1, mean)
+            cov = self.ew_s2 - cross - cross.T + w * np.outer(mean, mean)
+            return cov / max(w, 1e-12)
+        else:
+            raise ValueError("unknown covariance method")
+
+
 class PortfolioOptimizer:
     def __init__(self, cfg: OptimizerConfig):
         self.cfg = cfg
+        self._moments: _CovarianceMoments | None = None
+        self._moments_start = 0
+        self._moments_end = 0
+        # Cholesky factor of the regularized covariance of the folded window; reused until
+        # rows are folded in or dropped
+        self._folded_factor: Tuple[np.ndarray, bool] | None = None
+        # Reused by optimize_arrays for the demeaned return block
+        self._scratch = np.empty((0, 0))
 
     def optimize(
         self,
@@ -79,32 +238,159 @@ class PortfolioOptimizer:
         Returns weights Series and info dict.
         """
         tickers = list(mu.index)
-        x = returns[tickers].dropna()
-        if x.empty:
-            # no returns; equal weight within box
-            n = len(tickers)
-            w = np.full(n, min(1.0 / n, self.cfg.max_position))
-            w = w / w.sum()
-            return pd.Series(w, index=tickers), {"status": "no_returns"}
-
-        mu_vec = mu.to_numpy(dtype=float)
-        cov = _estimate_covariance(x, self.cfg.covariance, self.cfg.ewma_lambda)
-        # regularize Σ
+        w, info = self.optimize_arrays(
+            mu.to_numpy(dtype=float), returns[tickers].to_numpy(dtype=float), tickers
+        )
+        return pd.Series(w, index=tickers), info
+
+    def optimize_arrays(
+        self, mu: np.ndarray, returns: np.ndarray, tickers: Sequence[str]
+    ) -> Tuple[np.ndarray, dict]:
+        """
+        optimize() on raw arrays: `returns` is a (T, K) matrix whose columns follow `mu`
+        and `tickers` (rows with any NaN are skipped). Returns the weight array.
+        """
+        mu_vec = np.asarray(mu, dtype=float)
+        x = np.asarray(returns, dtype=float)
+        rows_with_nan = np.isnan(x).any(axis=1)
+        if rows_with_nan.any():
+            x = x[~rows_with_nan]
+        if x.size == 0:
+            return self._equal_weight_array(len(tickers))
+
+        cov = _estimate_covariance(
+            x,
+            self.cfg.covariance,
+            self.cfg.ewma_lambda,
+            self.cfg.covariance_dtype,
+            self.cfg.ledoit_wolf_impl,
+            scratch=self._demean_buffer(x.shape),
+        )
+        return self._weights_from_factor(mu_vec, self._factorize(cov), tickers)
+
+    def optimize_streaming(
+        self, mu: pd.Series, returns: np.ndarray, end: int, start: int = 0
+    ) -> Tuple[pd.Series, dict]:
+        """
+        Same as optimize(mu, returns[start:end]) for a NaN-free return matrix whose
+        columns follow mu.index. The window is kept as running moments between calls:
+        as `start` and `end` move forward only the rows entering or leaving it are
+        touched, so a growing or sliding window costs O(changed_rows * K^2) per call.
+        """
+        if (
+            self._moments is None
+            or end < self._moments_end
+            or start < self._moments_start
+            or start > self._moments_end
+        ):
+            self.reset_streaming()
+            self._moments_start = self._moments_end = start
+        self.fold_returns(
+            returns[self._moments_end : end],
+            dropped=returns[self._moments_start : start],
+            window=returns[start:end],
+        )
+        self._moments_start, self._moments_end = start, end
+        return self.optimize_folded(mu)
+
+    def fold_returns(
+        self,
+        added: np.ndarray,
+        dropped: np.ndarray | None = None,
+        window: np.ndarray | None = None,
+    ) -> None:
+        """
+        Fold new return rows into the running moments and remove `dropped`, the oldest
+        rows leaving the window (both oldest first). Removal accumulates rounding, so
+        once enough rows have been dropped the moments are rebuilt from `window`, the
+        full current window, when it is given.
+        """
+        if self._moments is None:
+            self._moments = _CovarianceMoments(added.shape[1], self.cfg.ewma_lambda)
+        if added.shape[0] or (dropped is not None and dropped.shape[0]):
+            self._folded_factor = None
+        self._moments.update(added)
+        if dropped is not None and dropped.shape[0]:
+            self._moments.drop(dropped)
+            if window is not None and self._moments.downdates >= _RESEED_EVERY:
+                self._moments = _CovarianceMoments(window.shape[1], self.cfg.ewma_lambda)
+                self._moments.update(window)
+
+    def optimize_folded(self, mu: pd.Series) -> Tuple[pd.Series, dict]:
+        """optimize() against the window currently held in the running moments."""
+        m = self._moments
+        if m is None or m.n == 0:
+            return self._equal_weight(list(mu.index))
+        if m.n < 2:
+            # tiny sample; same diagonal proxy as _estimate_covariance
+            return self._solve(mu, np.diag(np.full(len(mu), 1e-4)))
+        if self._folded_factor is None:
+            self._folded_factor = self._factorize(m.covariance(self.cfg.covariance))
+        return self._solve_factored(mu, self._folded_factor)
+
+    def folded_column_std(self) -> np.ndarray | None:
+        """Sample std of each column of the folded window, or None with under two rows."""
+        m = self._moments
+        if m is None or m.n < 2:
+            return None
+        return m.column_std()
+
+    def reset_streaming(self) -> None:
+        """Forget the running moments so the next streaming call starts afresh."""
+        self._moments = None
+        self._moments_start = 0
+        self._moments_end = 0
+        self._folded_factor = None
+
+    def _demean_buffer(self, shape: Tuple[int, int]) -> np.ndarray:
+        dtype = np.dtype(self.cfg.covariance_dtype)
+        if self._scratch.shape != shape or self._scratch.dtype != dtype:
+            self._scratch = np.empty(shape, dtype=dtype)
+        return self._scratch
+
+    def _equal_weight(self, tickers: list) -> Tuple[pd.Series, dict]:
+        w, info = self._equal_weight_array(len(tickers))
+        return pd.Series(w, index=tickers), info
+
+    def _equal_weight_array(self, n: int) -> Tuple[np.ndarray, dict]:
+        # no returns; equal weight within box. Renormalizing a constant vector always
+        # lands on 1/n whether or not the cap binds, so fill with it directly
+        w = np.full(n, 1.0 / n) if n else np.zeros(0)
+        return w, {"status": "no_returns"}
+
+    def _solve(self, mu: pd.Series, cov: np.ndarray) -> Tuple[pd.Series, dict]:
+        return self._solve_factored(mu, self._factorize(cov))
+
+    def _factorize(self, cov: np.ndarray) -> Tuple[np.ndarray, bool]:
+        # regularize Σ; it is symmetric PD after the jitter, so solve Σ x = μ through a
+        # Cholesky factor instead of forming the inverse. The jitter goes straight onto
+        # the diagonal of one copy rather than through a p x p identity
+        cov = cov.copy()
+        diag = cov.reshape(-1)[:: cov.shape[0] + 1]
         try:
             # ensure positive definite-ish
-            cov = cov + 1e-6 * np.eye(cov.shape[0])
-            inv = np.linalg.inv(cov)
+            diag += 1e-6
+            return cho_factor(cov, lower=True, check_finite=False)
         except np.linalg.LinAlgError:
-            cov = cov + 1e-4 * np.eye(cov.shape[0])
+            diag += 1e-4
             try:
-                inv = np.linalg.inv(cov)
+                return cho_factor(cov, lower=True, check_finite=False)
             except np.linalg.LinAlgError as e:
-                raise OptimizationError(f"covariance inversion failed: {e}")
+                raise OptimizationError(f"covariance factorization failed: {e}")
+
+    def _solve_factored(
+        self, mu: pd.Series, factor: Tuple[np.ndarray, bool]
+    ) -> Tuple[pd.Series, dict]:
+        tickers = list(mu.index)
+        w, info = self._weights_from_factor(mu.to_numpy(dtype=float), factor, tickers)
+        return pd.Series(w, index=tickers), info
 
+    def _weights_from_factor(
+        self, mu_vec: np.ndarray, factor: Tuple[np.ndarray, bool], tickers: Sequence[str]
+    ) -> Tuple[np.ndarray, dict]:
         lam = float(self.cfg.risk_aversion)
-        raw = (inv @ mu_vec) / max(lam, 1e-9)
+        raw = cho_solve(factor, mu_vec, check_finite=False) / max(lam, 1e-9)
         w = _project_to_simplex_box(raw, self.cfg.max_position)
-        w_series = pd.Series(w, index=tickers)
 
         min_ret = float(self.cfg.min_return)
         if min_ret > 0.0 and float(np.dot(w, mu_vec)) < min_ret:
@@ -113,7 +399,6 @@ class PortfolioOptimizer:
             alloc = np.array([risk_off.get(t, 0.0) for t in tickers])
             if alloc.sum() <= 0:
                 alloc = np.ones(len(tickers)) / len(tickers)
-            w_series = pd.Series(alloc / alloc.sum(), index=tickers)
-            return w_series, {"status": "fallback_risk_off", "reason": "min_return_not_met"}
+            return alloc / alloc.sum(), {"status": "fallback_risk_off", "reason": "min_return_not_met"}
 
-        return w_series, {"status": "ok"}
+        return w, {"status": "ok"}
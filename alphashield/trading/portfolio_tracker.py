@@ -1,27 +1,119 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Dict
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Dict, Optional
 
 import numpy as np
 
 
-@dataclass
 class PortfolioTracker:
-    positions: Dict[str, float] = field(default_factory=dict)
-    prices: Dict[str, float] = field(default_factory=dict)
-    _peak_value: float = 0.0
+    """
+    Positions and last prices held as arrays aligned by ticker slot, so valuation is one
+    dot product. ``positions`` / ``prices`` return read-only snapshots, so item writes raise
+    TypeError; change state through update_position() / update_price() or by assigning a
+    whole new mapping to either attribute.
+    """
+
+    def __init__(
+        self,
+        positions: Optional[Dict[str, float]] = None,
+        prices: Optional[Dict[str, float]] = None,
+    ) -> None:
+        self._idx: Dict[str, int] = {}
+        self._qty = np.zeros(0)
+        self._px = np.zeros(0)
+        self._held = np.zeros(0, dtype=bool)  # slots that have a position entry
+        self._priced = np.zeros(0, dtype=bool)  # slots that have a price entry
+        self._peak_value = 0.0
+        # Last valuation, reused until a position or price changes
+        self._total = 0.0
+        self._dirty = True
+        for ticker, qty in (positions or {}).items():
+            self.update_position(ticker, qty)
+        for ticker, price in (prices or {}).items():
+            self.update_price(ticker, price)
+
+    def _slot(self, ticker: str) -> int:
+        i = self._idx.get(ticker)
+        if i is None:
+            i = len(self._idx)
+            if i == self._qty.shape[0]:
+                # grow geometrically so adding tickers one at a time stays amortized O(1)
+                extra = max(i, 8)
+                self._qty = np.concatenate([self._qty, np.zeros(extra)])
+                self._px = np.concatenate([self._px, np.zeros(extra)])
+                self._held = np.concatenate([self._held, np.zeros(extra, dtype=bool)])
+                self._priced = np.concatenate([self._priced, np.zeros(extra, dtype=bool)])
+            self._idx[ticker] = i
+        return i
+
+    @property
+    def positions(self) -> Mapping[str, float]:
+        return MappingProxyType(
+            {t: float(self._qty[i]) for t, i in self._idx.items() if self._held[i]}
+        )
+
+    @positions.setter
+    def positions(self, positions: Mapping[str, float]) -> None:
+        self._qty[:] = 0.0
+        self._held[:] = False
+        self._dirty = True
+        for ticker, qty in positions.items():
+            self.update_position(ticker, qty)
+
+    @property
+    def prices(self) -> Mapping[str, float]:
+        return MappingProxyType(
+            {t: float(self._px[i]) for t, i in self._idx.items() if self._priced[i]}
+        )
+
+    @prices.setter
+    def prices(self, prices: Mapping[str, float]) -> None:
+        self._px[:] = 0.0
+        self._priced[:] = False
+        self._dirty = True
+        for ticker, price in prices.items():
+            self.update_price(ticker, price)
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(positions={dict(self.positions)!r}, "
+            f"prices={dict(self.prices)!r}, _peak_value={self._peak_value!r})"
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PortfolioTracker):
+            return NotImplemented
+        return (
+            self.positions == other.positions
+            and self.prices == other.prices
+            and self._peak_value == other._peak_value
+        )
+
+    __hash__ = None  # mutable, like the dataclass it replaced
+
+    def update_position(self, ticker: str, qty: float) -> None:
+        i = self._slot(ticker)
+        self._qty[i] = float(qty)
+        self._held[i] = True
+        self._dirty = True
 
     def update_price(self, ticker: str, price: float) -> None:
-        self.prices[ticker] = float(price)
+        i = self._slot(ticker)
+        self._px[i] = float(price)
+        self._priced[i] = True
+        self._dirty = True
 
     def get_total_value(self) -> float:
-        total = 0.0
-        for ticker, qty in self.positions.items():
-            price = float(self.prices.get(ticker, 0.0))
-            total += float(qty) * price
-        self._peak_value = max(self._peak_value, total)
-        return total
+        if self._dirty:
+            # Only held slots are valued: a NaN/inf price on a ticker without a position
+            # must not leak in through 0 * price. Unpriced held tickers contribute zero
+            held = self._held
+            self._total = float(self._qty[held] @ self._px[held])
+            self._peak_value = max(self._peak_value, self._total)
+            self._dirty = False
+        return self._total
 
     def get_drawdown(self) -> float:
         total = self.get_total_value()
@@ -31,6 +123,9 @@ class PortfolioTracker:
 
     def get_weights(self) -> Dict[str, float]:
         total = self.get_total_value()
+        tickers = [t for t, i in self._idx.items() if self._held[i]]
         if total <= 0:
-            return {t: 0.0 for t in self.positions}
-        return {t: (self.prices.get(t, 0.0) * q) / total for t, q in self.positions.items()}
+            return {t: 0.0 for t in tickers}
+        held = np.flatnonzero(self._held)
+        weights = self._qty[held] * self._px[held] / total
+        return dict(zip(tickers, weights.tolist(), strict=True))
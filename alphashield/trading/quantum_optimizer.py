@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, Tuple
 
 import numpy as np
 
@@ -12,6 +13,16 @@ except Exception:  # pragma: no cover
     DWaveSampler = None  # type: ignore
     EmbeddingComposite = None  # type: ignore
 
+# Above this many binary variables (n_assets * num_bins) minor embedding on the annealer
+# becomes prohibitively slow, so larger problems take the heuristic path
+_MAX_QUBO_VARIABLES = 400
+
+
+@lru_cache(maxsize=32)
+def _variable_names(n_assets: int, num_bins: int) -> Tuple[str, ...]:
+    """QUBO variable names x_{asset}_{bin}, asset-major, built once per problem shape."""
+    return tuple(f"x_{i}_{b}" for i in range(n_assets) for b in range(num_bins))
+
 
 class QuantumPortfolioOptimizer:
     """Quantum portfolio optimization using a QUBO formulation."""
@@ -36,20 +47,35 @@ class QuantumPortfolioOptimizer:
         num_reads: int = 1000,
     ) -> np.ndarray:
         """
-        Optimize portfolio weights via QUBO. If quantum backend is unavailable,
-        return a simple heuristic allocation proportional to expected returns.
+        Optimize portfolio weights via QUBO. If quantum backend is unavailable, or the
+        QUBO would exceed _MAX_QUBO_VARIABLES, return a simple heuristic allocation
+        proportional to expected returns.
         """
         n_assets = expected_returns.shape[0]
 
-        if not self.available or self._sampler is None or dimod is None:
+        if (
+            not self.available
+            or self._sampler is None
+            or dimod is None
+            or n_assets * num_bins > _MAX_QUBO_VARIABLES
+        ):
             # Heuristic fallback: softmax over expected returns
             logits = expected_returns - expected_returns.max()
             exp = np.exp(logits)
             w = exp / exp.sum()
             return w
 
-        Q = self._build_qubo_matrix(expected_returns, covariance_matrix, risk_aversion, num_bins)
-        bqm = dimod.BinaryQuadraticModel.from_qubo(Q)
+        M = self._build_qubo_dense(expected_returns, covariance_matrix, risk_aversion, num_bins)
+        # Hand dimod the biases as arrays: diagonal -> linear, strict upper triangle ->
+        # quadratic, the same model from_qubo builds from the dict form
+        rows, cols = np.triu_indices(M.shape[0], k=1)
+        bqm = dimod.BinaryQuadraticModel.from_numpy_vectors(
+            np.diagonal(M),
+            (rows, cols, M[rows, cols]),
+            0.0,
+            dimod.BINARY,
+            variable_order=list(_variable_names(n_assets, num_bins)),
+        )
         sampleset = self._sampler.sample(bqm, num_reads=num_reads)
         best_sample = sampleset.first.sample
         weights = self._decode_solution(best_sample, n_assets, num_bins)
@@ -62,45 +88,52 @@ class QuantumPortfolioOptimizer:
         lambda_risk: float,
         num_bins: int,
     ):
-        n = len(mu)
+        """QUBO as a {(var, var): bias} dict; keys order the two names as strings."""
+        M = self._build_qubo_dense(mu, Sigma, lambda_risk, num_bins)
+        names = _variable_names(len(mu), num_bins)
+        rows, cols = np.triu_indices(M.shape[0])
         Q: dict[tuple[str, str], float] = {}
-        # Quadratic terms
-        for i in range(n):
-            for j in range(n):
-                for bi in range(num_bins):
-                    for bj in range(num_bins):
-                        vi = f"x_{i}_{bi}"
-                        vj = f"x_{j}_{bj}"
-                        risk_term = lambda_risk * float(Sigma[i, j]) * (bi * bj) / (num_bins**2)
-                        return_term = 0.0
-                        if i == j and bi == bj:
-                            return_term = -float(mu[i]) * (bi / num_bins)
-                        key = (vi, vj) if vi <= vj else (vj, vi)
-                        Q[key] = Q.get(key, 0.0) + risk_term + return_term
-
-        # Investment constraint penalty: (sum w - 1)^2
-        penalty = 10.0
-        for i in range(n):
-            for bi in range(num_bins):
-                vi = f"x_{i}_{bi}"
-                key = (vi, vi)
-                Q[key] = Q.get(key, 0.0) + penalty * (bi / num_bins) ** 2
-                for j in range(i, n):
-                    for bj in range(num_bins):
-                        vj = f"x_{j}_{bj}"
-                        if vi == vj:
-                            continue
-                        key2 = (vi, vj) if vi <= vj else (vj, vi)
-                        Q[key2] = Q.get(key2, 0.0) + 2.0 * penalty * (bi * bj) / (num_bins**2)
+        for r, c, v in zip(rows.tolist(), cols.tolist(), M[rows, cols].tolist(), strict=True):
+            vi, vj = names[r], names[c]
+            Q[(vi, vj) if vi <= vj else (vj, vi)] = v
         return Q
 
+    def _build_qubo_dense(
+        self,
+        mu: np.ndarray,
+        Sigma: np.ndarray,
+        lambda_risk: float,
+        num_bins: int,
+    ) -> np.ndarray:
+        """
+        Symmetric QUBO matrix over the variables of _variable_names: linear biases on the
+        diagonal, each pair's total coupling on both off-diagonal entries.
+        """
+        n = len(mu)
+        levels = np.arange(num_bins, dtype=np.float64)
+        frac = levels / num_bins
+        scaled = np.outer(levels, levels) / (num_bins**2)  # (bi * bj) / num_bins^2
+        # Variable k = i * num_bins + bi stands for asset i at weight level bi / num_bins
+
+        # Quadratic terms: every ordered (k, l) pair lands on the same unordered key
+        risk = lambda_risk * np.kron(np.asarray(Sigma, dtype=np.float64), scaled)
+        M = risk + risk.T
+        diag = np.diagonal(risk) - np.repeat(np.asarray(mu, dtype=np.float64), num_bins) * np.tile(frac, n)
+
+        # Investment constraint penalty: (sum w - 1)^2. Pairs within one asset are visited
+        # in both orders, hence twice the cross-asset coupling
+        penalty = 10.0
+        M += 2.0 * penalty * np.kron(np.ones((n, n)) + np.eye(n), scaled)
+        diag += penalty * np.tile(frac**2, n)
+        np.fill_diagonal(M, diag)
+        return M
+
     def _decode_solution(self, sample: dict[str, int], n_assets: int, num_bins: int) -> np.ndarray:
-        weights = np.zeros(n_assets)
-        for i in range(n_assets):
-            for b in range(num_bins):
-                var = f"x_{i}_{b}"
-                if int(sample.get(var, 0)) == 1:
-                    weights[i] += b / num_bins
+        names = _variable_names(n_assets, num_bins)
+        bits = np.fromiter(
+            (int(sample.get(v, 0)) == 1 for v in names), dtype=bool, count=len(names)
+        ).reshape(n_assets, num_bins)
+        weights = bits @ (np.arange(num_bins) / num_bins)
         s = weights.sum()
         if s <= 0:
             return np.ones(n_assets) / n_assets
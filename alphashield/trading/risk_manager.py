@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict
+from typing import Dict, Tuple
 
 import numpy as np
 
@@ -12,6 +12,41 @@ class EmergencyDecision:
     instructions: str
 
 
+def _var_and_cvar(returns: np.ndarray, confidence: float) -> Tuple[float, float]:
+    """
+    Historical VaR, as np.percentile(returns, (1 - confidence) * 100), and CVaR (mean of
+    returns at or below VaR) from a single O(N) partition.
+    """
+    a = np.asarray(returns, dtype=float).ravel()
+    n = a.size
+    if n == 0:
+        return 0.0, 0.0
+    # Same virtual index and interpolation as np.percentile's default "linear" method
+    h = (n - 1) * (((1 - confidence) * 100) / 100)
+    lo = int(np.floor(h))
+    if h >= n - 1:
+        lo = hi = n - 1
+    else:
+        hi = lo + 1
+    part = np.partition(a, np.unique([lo, hi, n - 1]))
+    if np.isnan(part[-1]):
+        return float("nan"), float("nan")
+    below, above = part[lo], part[hi]
+    gamma = h - lo
+    diff = above - below
+    var = above - diff * (1 - gamma) if gamma >= 0.5 else below + diff * gamma
+    # Everything left of `lo` is <= part[lo] <= var and everything right of `hi` is
+    # >= part[hi] >= var, so only values equal to var can sit in the upper block
+    tail_sum = float(part[: lo + 1].sum())
+    tail_n = lo + 1
+    if above == var and hi > lo:
+        upper = part[hi:]
+        ties = upper <= var
+        tail_sum += float(upper[ties].sum())
+        tail_n += int(ties.sum())
+    return float(var), tail_sum / tail_n
+
+
 class RiskManager:
     """
     Real-time risk monitoring and position sizing with coverage ratio protocols.
@@ -31,9 +66,10 @@ class RiskManager:
     ) -> float:
         if avg_loss == 0:
             return 0.0
-        b = avg_win / avg_loss
-        kelly_fraction = (win_rate * b - (1 - win_rate)) / b
-        kelly_fraction = float(np.clip(kelly_fraction, 0.0, 0.25))
+        # (p*b - q) / b with b = avg_win / avg_loss, simplified to one divide
+        kelly_fraction = float(win_rate - (1 - win_rate) * (avg_loss / avg_win))
+        # clamp to [0, 0.25] on Python floats (NaN passes through, as with np.clip)
+        kelly_fraction = min(max(kelly_fraction, 0.0), 0.25)
         if current_cr < 1.5:
             cr_adjustment = max(0.0, (current_cr - 1.2) / 0.3)
             kelly_fraction *= cr_adjustment
@@ -46,18 +82,16 @@ class RiskManager:
         return bool(loss > stop_loss_pct)
 
     def calculate_var(self, returns: np.ndarray, confidence: float = 0.95) -> float:
-        if returns.size == 0:
-            return 0.0
-        return float(np.percentile(returns, (1 - confidence) * 100))
+        return _var_and_cvar(returns, confidence)[0]
 
     def calculate_cvar(self, returns: np.ndarray, confidence: float = 0.95) -> float:
-        if returns.size == 0:
-            return 0.0
-        var = self.calculate_var(returns, confidence)
-        tail = returns[returns <= var]
-        if tail.size == 0:
-            return var
-        return float(tail.mean())
+        return _var_and_cvar(returns, confidence)[1]
+
+    def calculate_var_cvar(
+        self, returns: np.ndarray, confidence: float = 0.95
+    ) -> Tuple[float, float]:
+        """(VaR, CVaR) sharing one partition of `returns`."""
+        return _var_and_cvar(returns, confidence)
 
     def emergency_mode_check(self, coverage_ratio: float, portfolio_drawdown: float) -> EmergencyDecision:
         if coverage_ratio < 1.2 or portfolio_drawdown > self.max_drawdown:
@@ -30,21 +30,12 @@ class MomentumSignal:
             # Require at least ~1 year of data for stable momentum computation
             return pd.Series(0.0, index=prices.columns)
 
-        returns_3m = prices.pct_change(63)
-        returns_6m = prices.pct_change(126)
-        returns_12m = prices.pct_change(252)
-
-        momentum_score = (
-            0.5 * returns_3m + 0.3 * returns_6m + 0.2 * returns_12m
-        )
-
-        latest_scores = momentum_score.iloc[-1].replace([np.inf, -np.inf], np.nan).fillna(0.0)
-
-        # Normalize to [-1, 1]
-        ranks = latest_scores.rank(pct=True)
-        signals = ranks * 2.0 - 1.0
-        signals = signals.clip(-1.0, 1.0)
-        return signals
+        # Only the latest 3M/6M/12M returns are used: read them as ratios of two rows of
+        # the gap-padded prices rather than running pct_change over the whole frame
+        p = prices.to_numpy(dtype=float)
+        # only the 253 trailing rows are read, so gaps further back need no padding
+        padded = prices.ffill().to_numpy(dtype=float) if np.isnan(p[-253:]).any() else p
+        return pd.Series(_momentum_latest(padded), index=prices.columns)
 
 
 class MeanReversionSignal:
@@ -71,14 +62,7 @@ class MeanReversionSignal:
         if prices.shape[0] < 20:
             return pd.Series(0.0, index=prices.columns)
 
-        ma_20 = prices.rolling(20).mean()
-        std_20 = prices.rolling(20).std().replace(0.0, np.nan)
-        z_score = (prices - ma_20) / std_20
-
-        latest_z = z_score.iloc[-1].replace([np.inf, -np.inf], np.nan).fillna(0.0)
-        signals = -latest_z.clip(-2.0, 2.0) / 2.0
-        signals = signals.clip(-1.0, 1.0)
-        return signals
+        return pd.Series(_mean_reversion_latest(prices.to_numpy(dtype=float)), index=prices.columns)
 
 
 class TrendFollowingSignal:
@@ -104,20 +88,10 @@ class TrendFollowingSignal:
         if prices.shape[0] < 200:
             return pd.Series(0.0, index=prices.columns)
 
-        ma_50 = prices.rolling(50).mean()
-        ma_200 = prices.rolling(200).mean()
-
-        crossover = (ma_50.iloc[-1] > ma_200.iloc[-1]).astype(float) * 2.0 - 1.0
-
-        daily_vol = prices.pct_change().rolling(14).std()
-        denom = daily_vol.iloc[-1].replace(0.0, np.nan)
-        trend_strength = (ma_50.iloc[-1] - ma_200.iloc[-1]).abs() / denom
-        trend_strength = trend_strength.replace([np.inf, -np.inf], np.nan).fillna(0.0)
-        trend_strength = trend_strength.clip(0.0, 1.0)
-
-        signal = crossover * trend_strength
-        signal = signal.clip(-1.0, 1.0)
-        return signal
+        p = prices.to_numpy(dtype=float)
+        # pct_change pads gaps before differencing, which can reach back past the tail
+        padded = prices.ffill().to_numpy(dtype=float) if np.isnan(p[-15:]).any() else p
+        return pd.Series(_trend_latest(p, padded), index=prices.columns)
 
 
 class VolatilitySignal:
@@ -142,22 +116,35 @@ class VolatilitySignal:
         if vix_data.shape[0] < 50:
             return 0.0
 
-        current_vix = float(vix_data.iloc[-1])
-        vix_ma = float(vix_data.rolling(50).mean().iloc[-1])
+        # Only the latest 50-day average is needed, so average the trailing 50 values
+        tail = vix_data.to_numpy(dtype=float)[-50:]
+        current_vix = float(tail[-1])
+        vix_ma = float(_tail_mean_std(tail.reshape(-1, 1))[0][0])
         if vix_ma == 0:
             return 0.0
 
         signal = (vix_ma - current_vix) / vix_ma
-        return float(np.clip(signal, -1.0, 1.0))
+        return min(max(signal, -1.0), 1.0)
 
 
 Regime = Literal["low_vol", "balanced", "high_vol"]
 
+# Regime weights for SignalAggregator, built once; each vector follows _AGGREGATED_STRATEGIES
+_AGGREGATED_STRATEGIES = ("momentum", "trend_following", "mean_reversion")
+_REGIME_WEIGHTS: Dict[str, np.ndarray] = {
+    "low_vol": np.array([0.6, 0.2, 0.2]),
+    "balanced": np.array([0.4, 0.3, 0.3]),
+    "high_vol": np.array([0.2, 0.2, 0.6]),
+}
+
 
 class SignalAggregator:
     """Combines signals based on market regime and volatility overlay."""
 
-    def __init__(self) -> None:
+    def __init__(self, dtype: str = "float64") -> None:
+        # "float32" computes the strategy statistics in single precision: half the memory
+        # traffic, ~1e-6 relative error in z-scores and vol ratios
+        self.dtype = dtype
         self.strategies = {
             "momentum": MomentumSignal(),
             "mean_reversion": MeanReversionSignal(),
@@ -179,34 +166,17 @@ class SignalAggregator:
         - balanced:   40% momentum, 30% trend, 30% mean_rev
         - high_vol:   20% momentum, 20% trend, 60% mean_rev
         """
-        weights: Dict[str, Dict[str, float]] = {
-            "low_vol": {"momentum": 0.6, "trend_following": 0.2, "mean_reversion": 0.2},
-            "balanced": {"momentum": 0.4, "trend_following": 0.3, "mean_reversion": 0.3},
-            "high_vol": {"momentum": 0.2, "trend_following": 0.2, "mean_reversion": 0.6},
-        }
-        if regime not in weights:
-            regime = "balanced"
-
-        momentum = self.strategies["momentum"].generate_signal(prices)
-        mean_rev = self.strategies["mean_reversion"].generate_signal(prices)
-        trend = self.strategies["trend_following"].generate_signal(prices)
-
-        components: Dict[str, pd.Series] = {
-            "momentum": momentum,
-            "mean_reversion": mean_rev,
-            "trend_following": trend,
-        }
-
-        # Start with zeros for safe addition
-        final_signal = pd.Series(0.0, index=prices.columns)
-        for strategy_name, weight in weights[regime].items():
-            final_signal = final_signal.add(components[strategy_name] * weight, fill_value=0.0)
+        components = _strategy_signals(prices, self.dtype)
+        weights = _REGIME_WEIGHTS.get(regime, _REGIME_WEIGHTS["balanced"])
+        blended = weights @ np.stack([components[name] for name in _AGGREGATED_STRATEGIES])
 
         vol_signal = self.strategies["volatility"].generate_signal(vix)
         if vol_signal < -0.5:
-            final_signal *= 0.5
+            blended *= 0.5
 
-        return final_signal.clip(-1.0, 1.0)
+        # Clip the raw array before wrapping; Series.clip costs far more than the data
+        final_signal = np.minimum(np.maximum(blended, -1.0), 1.0)
+        return pd.Series(final_signal, index=prices.columns, dtype=float)
 
 
 # === Light-weight API for Phase 1 tests ===
@@ -221,33 +191,43 @@ def momentum_signal(prices: _pd.DataFrame, window_6m: int = 126, window_12m: int
     """
     if prices.shape[0] < max(window_6m, window_12m):
         return _pd.Series(0.5, index=prices.columns)
-    r6 = prices.pct_change(window_6m).iloc[-1]
-    r12 = prices.pct_change(window_12m).iloc[-1]
+    p = prices.to_numpy(dtype=float)
+    t, n = p.shape
+    # pct_change pads gaps, so the latest return is a ratio of two padded rows
+    padded = prices.ffill().to_numpy(dtype=float) if _np.isnan(p).any() else p
+    with _np.errstate(divide="ignore", invalid="ignore"):
+        r6 = padded[-1] / padded[-1 - window_6m] - 1.0 if t > window_6m else _np.full(n, _np.nan)
+        r12 = padded[-1] / padded[-1 - window_12m] - 1.0 if t > window_12m else _np.full(n, _np.nan)
     score = 0.6 * r6 + 0.4 * r12
-    ranks = score.rank(pct=True).fillna(0.5)
-    return ranks.clip(0.0, 1.0)
+    ranks = _np.full(n, 0.5)
+    valid = ~_np.isnan(score)
+    if valid.any():
+        ranks[valid] = _pct_rank(score[valid])
+    return _pd.Series(ranks, index=prices.columns)
 
 
 def trend_sma200_signal(prices: _pd.DataFrame, window: int = 200) -> _pd.Series:
     """Binary 1/0 based on price above SMA200. Returns in [0,1]."""
     if prices.shape[0] < window:
         return _pd.Series(0.5, index=prices.columns)
-    sma = prices.rolling(window).mean().iloc[-1]
-    last = prices.iloc[-1]
-    return (last > sma).astype(float)
+    tail = prices.to_numpy(dtype=float)[-window:]
+    sma, _ = _tail_mean_std(tail)
+    return _pd.Series((tail[-1] > sma).astype(float), index=prices.columns)
 
 
 def mean_reversion_signal(prices: _pd.DataFrame, window: int = 20) -> _pd.Series:
     """Inverted z-score vs rolling mean; higher means more oversold (buy dips). Returns scaled to [0,1]."""
     if prices.shape[0] < window:
         return _pd.Series(0.5, index=prices.columns)
-    ma = prices.rolling(window).mean().iloc[-1]
-    std = prices.rolling(window).std().iloc[-1].replace(0.0, _np.nan)
-    z = (prices.iloc[-1] - ma) / std
-    inv = -z.replace([_np.inf, -_np.inf], _np.nan).fillna(0.0)
+    tail = prices.to_numpy(dtype=float)[-window:]
+    ma, std = _tail_mean_std(tail)
+    std[std == 0.0] = _np.nan
+    with _np.errstate(divide="ignore", invalid="ignore"):
+        inv = -((tail[-1] - ma) / std)
+    inv[~_np.isfinite(inv)] = 0.0
     # scale inv z to [0,1] by clipping at +/-2 and mapping [-2,2] -> [0,1]
-    clipped = inv.clip(-2.0, 2.0)
-    return (clipped + 2.0) / 4.0
+    clipped = _np.minimum(_np.maximum(inv, -2.0), 2.0)
+    return _pd.Series((clipped + 2.0) / 4.0, index=prices.columns)
 
 
 def combine_signals(components: dict, weights: dict | None = None) -> _pd.Series:
@@ -257,15 +237,172 @@ def combine_signals(components: dict, weights: dict | None = None) -> _pd.Series
     if not components:
         raise ValueError("components must be non-empty")
     idx = next(iter(components.values())).index
-    total = _pd.Series(0.0, index=idx)
     if weights is None:
         weights = {k: 1.0 / len(components) for k in components}
-    wsum = sum(float(weights.get(k, 0.0)) for k in components)
+    w = _np.array([float(weights.get(k, 0.0)) for k in components])
+    wsum = float(w.sum())
+    if wsum <= 0:
+        raise ValueError("sum of weights must be positive")
+    # One (K, N) block of aligned components, blended in a single matrix-vector product
+    mat = _np.stack(
+        [series.reindex(idx).to_numpy(dtype=float) for series in components.values()]
+    )
+    mat[_np.isnan(mat)] = 0.5
+    _np.maximum(mat, 0.0, out=mat)
+    _np.minimum(mat, 1.0, out=mat)
+    return _pd.Series(_np.minimum(_np.maximum(w @ mat / wsum, 0.0), 1.0), index=idx)
+
+
+
+def signal_to_expected_return(combined: _pd.Series, scale: float = 0.20) -> _pd.Series:
+    """
+    Expected-return proxy (combined - 0.5) * scale, built from the raw array in one step.
+    """
+    return _pd.Series((combined.to_numpy(dtype=float) - 0.5) * scale, index=combined.index)
+
+
+def _tail_mean_std(tail: _np.ndarray, ddof: int = 1) -> tuple[_np.ndarray, _np.ndarray]:
+    """Column mean/std of a full rolling window, NaN where the window has gaps.
+
+    Constant columns get their value and a zero std exactly, as pandas' rolling
+    kernels guarantee, rather than whatever summation rounding produces.
+    """
+    with _np.errstate(divide="ignore", invalid="ignore"):
+        mean = tail.mean(axis=0)
+        std = tail.std(axis=0, ddof=ddof)
+    const = tail.max(axis=0) == tail.min(axis=0)
+    mean[const] = tail[0, const]
+    std[const] = 0.0
+    return mean, std
+
+
+def combined_signal(
+    prices: _pd.DataFrame,
+    window_6m: int = 126,
+    window_12m: int = 252,
+    trend_window: int = 200,
+    meanrev_window: int = 20,
+    weights: dict | None = None,
+) -> _pd.Series:
+    """
+    combine_signals over momentum_signal, trend_sma200_signal and mean_reversion_signal,
+    computed from one price array and only the trailing rows each statistic needs.
+    """
+    if weights is None:
+        weights = {"momentum": 1.0 / 3, "trend": 1.0 / 3, "meanrev": 1.0 / 3}
+    w_mom = float(weights.get("momentum", 0.0))
+    w_tr = float(weights.get("trend", 0.0))
+    w_mr = float(weights.get("meanrev", 0.0))
+    wsum = w_mom + w_tr + w_mr
     if wsum <= 0:
         raise ValueError("sum of weights must be positive")
-    for name, series in components.items():
-        w = float(weights.get(name, 0.0))
-        s = series.reindex(idx).fillna(0.5).clip(0.0, 1.0)
-        total = total.add(w * s, fill_value=0.0)
-    total = total / wsum
-    return total.clip(0.0, 1.0)
+
+    p = prices.to_numpy(dtype=float)
+    t, n = p.shape
+    last = p[-1] if t else _np.full(n, _np.nan)
+
+    # Momentum: pct_change pads gaps, then percentile-rank the blended 6M/12M return
+    mom = _np.full(n, 0.5)
+    if t >= max(window_6m, window_12m):
+        padded = prices.ffill().to_numpy(dtype=float) if _np.isnan(p).any() else p
+        with _np.errstate(divide="ignore", invalid="ignore"):
+            r6 = padded[-1] / padded[-1 - window_6m] - 1.0 if t > window_6m else _np.full(n, _np.nan)
+            r12 = padded[-1] / padded[-1 - window_12m] - 1.0 if t > window_12m else _np.full(n, _np.nan)
+        score = 0.6 * r6 + 0.4 * r12
+        valid = ~_np.isnan(score)
+        if valid.any():
+            mom[valid] = _pct_rank(score[valid])
+
+    # Trend: last price above its full-window SMA
+    trend = _np.full(n, 0.5)
+    if t >= trend_window:
+        sma, _ = _tail_mean_std(p[-trend_window:])
+        trend = (last > sma).astype(float)
+
+    # Mean reversion: inverted z-score clipped to [-2, 2] and mapped onto [0, 1]
+    meanrev = _np.full(n, 0.5)
+    if t >= meanrev_window:
+        ma, std = _tail_mean_std(p[-meanrev_window:])
+        std[std == 0.0] = _np.nan
+        with _np.errstate(divide="ignore", invalid="ignore"):
+            inv = -((last - ma) / std)
+        inv[~_np.isfinite(inv)] = 0.0
+        meanrev = (_np.minimum(_np.maximum(inv, -2.0), 2.0) + 2.0) / 4.0
+
+    # All three components already lie in [0, 1]; only the blend can leave it, when a
+    # weight is negative
+    total = w_mom * mom
+    total += w_tr * trend
+    total += w_mr * meanrev
+    return _pd.Series(_np.minimum(_np.maximum(total / wsum, 0.0), 1.0), index=prices.columns)
+
+
+def _pct_rank(s: _np.ndarray) -> _np.ndarray:
+    """Average-method percentile ranks of a NaN-free vector, as Series.rank(pct=True)."""
+    # Ties occupy sorted positions left+1..right, so their average rank is (left+right+1)/2
+    ordered = _np.sort(s)
+    left = _np.searchsorted(ordered, s, side="left")
+    right = _np.searchsorted(ordered, s, side="right")
+    return (left + right + 1) / 2.0 / s.size
+
+
+def _momentum_latest(padded: _np.ndarray) -> _np.ndarray:
+    """MomentumSignal on a gap-padded price array with at least 252 rows."""
+    t, n = padded.shape
+    score = _np.zeros(n)
+    with _np.errstate(divide="ignore", invalid="ignore"):
+        for weight, lag in ((0.5, 63), (0.3, 126), (0.2, 252)):
+            # a lag reaching before the first row has no return, as with pct_change
+            ret = padded[-1] / padded[-1 - lag] - 1.0 if t > lag else _np.full(n, _np.nan)
+            score += weight * ret
+    score[~_np.isfinite(score)] = 0.0
+    # percentile ranks lie in (0, 1], so the signal is already within [-1, 1]
+    return _pct_rank(score) * 2.0 - 1.0 if n else score
+
+
+def _mean_reversion_latest(p: _np.ndarray) -> _np.ndarray:
+    """MeanReversionSignal from the trailing 20 rows of a price array."""
+    tail = p[-20:]
+    ma_20, std_20 = _tail_mean_std(tail)
+    std_20[std_20 == 0.0] = _np.nan
+    with _np.errstate(divide="ignore", invalid="ignore"):
+        latest_z = (tail[-1] - ma_20) / std_20
+    latest_z[~_np.isfinite(latest_z)] = 0.0
+    return _np.minimum(_np.maximum(latest_z, -2.0), 2.0) * -0.5
+
+
+def _trend_latest(p: _np.ndarray, padded: _np.ndarray) -> _np.ndarray:
+    """TrendFollowingSignal: MAs from the last 200 rows, 14-day vol from the last 15 padded."""
+    ma_50, _ = _tail_mean_std(p[-50:])
+    ma_200, _ = _tail_mean_std(p[-200:])
+    crossover = (ma_50 > ma_200).astype(float) * 2.0 - 1.0
+    tail = padded[-15:]
+    with _np.errstate(divide="ignore", invalid="ignore"):
+        _, daily_vol = _tail_mean_std(tail[1:] / tail[:-1] - 1.0)
+        daily_vol[daily_vol == 0.0] = _np.nan
+        strength = _np.abs(ma_50 - ma_200) / daily_vol
+    strength[~_np.isfinite(strength)] = 0.0
+    # crossover is +/-1 and the strength is clipped to [0, 1], so no outer clip is needed
+    return crossover * _np.minimum(_np.maximum(strength, 0.0), 1.0)
+
+
+def _strategy_signals(prices: _pd.DataFrame, dtype: str = "float64") -> Dict[str, _np.ndarray]:
+    """
+    Momentum, mean-reversion and trend-following signals for the latest row, as their
+    generate_signal methods compute them, from one price array and one gap-padding pass.
+    """
+    # One float64 array shared by every strategy; `prices` is not read again. No statistic
+    # reads further back than the 12M momentum lag, so only those rows are scanned for
+    # gaps and cast to the working dtype. Padding only matters when they contain a gap
+    full = prices.to_numpy(dtype=float)
+    t, n = full.shape
+    p = full[-253:].astype(dtype, copy=False)
+    padded = p
+    if _np.isnan(full[-253:]).any():
+        padded = prices.ffill().to_numpy(dtype=float)[-253:].astype(dtype, copy=False)
+    zeros = _np.zeros(n)
+    return {
+        "momentum": _momentum_latest(padded) if t >= 252 else zeros,
+        "mean_reversion": _mean_reversion_latest(p) if t >= 20 else zeros,
+        "trend_following": _trend_latest(p, padded) if t >= 200 else zeros,
+    }
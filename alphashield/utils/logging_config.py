@@ -1,16 +1,31 @@
 from __future__ import annotations
 
+import atexit
 import json
 import logging
 import os
-from logging.handlers import RotatingFileHandler
-from typing import Any
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Any, Optional
+
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore
 
 
 LOG_DIR = os.path.join(os.getcwd(), "logs")
 LOG_FILE = os.path.join(LOG_DIR, "trading.log")
 
 
+def json_dumps(obj: Any) -> str:
+    """JSON-encode obj, with orjson when installed; unknown types fall back to str()."""
+    if orjson is not None:
+        opts = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        return orjson.dumps(obj, default=str, option=opts).decode()
+    return json.dumps(obj, default=str)
+
+
 def _ensure_log_dir() -> None:
     try:
         os.makedirs(LOG_DIR, exist_ok=True)
@@ -40,31 +55,50 @@ class JsonFormatter(logging.Formatter):
         ]:
             if hasattr(record, key):
                 payload[key] = getattr(record, key)
-        return json.dumps(payload, default=str)
+        return json_dumps(payload)
 
 
 _def_level = os.getenv("LOG_LEVEL", "INFO").upper()
 
 
-def get_logger(name: str) -> logging.Logger:
-    _ensure_log_dir()
-    logger = logging.getLogger(name)
-    if logger.handlers:
-        return logger
-    logger.setLevel(_def_level)
+_listener: Optional[QueueListener] = None
+_log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
 
+
+def _start_listener() -> QueueListener:
+    """Start the background thread that formats and writes queued records."""
+    global _listener
+    if _listener is not None:
+        return _listener
+    _ensure_log_dir()
     formatter = JsonFormatter()
 
     # File handler
-    fh = RotatingFileHandler(LOG_FILE, maxBytes=2_000_000, backupCount=2)
+    fh = RotatingFileHandler(LOG_FILE, maxBytes=2_000_000, backupCount=2, delay=True)
     fh.setLevel(_def_level)
     fh.setFormatter(formatter)
-    logger.addHandler(fh)
 
     # Console handler
     ch = logging.StreamHandler()
     ch.setLevel(_def_level)
     ch.setFormatter(formatter)
-    logger.addHandler(ch)
 
+    _listener = QueueListener(_log_queue, fh, ch, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)  # drain what is still queued at shutdown
+    return _listener
+
+
+def get_logger(name: str) -> logging.Logger:
+    """
+    Logger whose records are queued in the calling thread and written (JSON, to the
+    rotating file and the console) by a shared background thread, keeping file and
+    stdout I/O off the trading loop.
+    """
+    logger = logging.getLogger(name)
+    if logger.handlers:
+        return logger
+    logger.setLevel(_def_level)
+    _start_listener()
+    logger.addHandler(QueueHandler(_log_queue))
     return logger
@@ -7,6 +7,25 @@ from trading_core.portfolio.optimizer_qp import optimize_classical
 from trading_core.risk.guardrails import RiskLimits, enforce_caps, check_risk_limits
 from finance.coverage import LoanTerms, coverage_ratio
 
+def _mean_rolling_std(x: np.ndarray, window: int) -> np.ndarray:
+    """
+    Per-column average of the full-window rolling std (ddof=1), from running sums of the
+    demeaned values rather than a rolling frame. NaN for columns shorter than the window.
+    """
+    n_win = x.shape[0] - window + 1
+    if n_win <= 0:
+        return np.full(x.shape[1], np.nan)
+    d = x - x.mean(axis=0)
+    c1 = np.zeros((x.shape[0] + 1, x.shape[1]))
+    c2 = np.zeros_like(c1)
+    np.cumsum(d, axis=0, out=c1[1:])
+    np.cumsum(d * d, axis=0, out=c2[1:])
+    s1 = c1[window:] - c1[:n_win]
+    s2 = c2[window:] - c2[:n_win]
+    var = (s2 - s1 * s1 / window) / (window - 1)
+    return np.sqrt(np.maximum(var, 0.0, out=var)).mean(axis=0)
+
+
 class BacktestEngine:
     """
     Minimal event-driven backtest:
@@ -37,6 +56,10 @@ class BacktestEngine:
         self.spread = spread_bps / 1e4
         self.turnover_budget = turnover_budget
 
+        # Daily close-to-close returns, computed once and read by row position in step()
+        self._day_returns = self.data[self.symbols].pct_change().to_numpy(dtype=float)
+        self._scratch = np.empty(len(self.symbols))  # reused for turnover deltas
+
         self.nav_history: List[float] = []
         self.cr_history: List[float] = []
 
@@ -44,19 +67,21 @@ class BacktestEngine:
         tr = trend_signals(prices)
         mr = meanrev_signals(prices)
         # Simple vol-aware mix: more mean-rev in high vol
-        rets = prices.pct_change().dropna()
-        recent_vol = rets.rolling(20).std().iloc[-1].mean()
-        long_vol = rets.rolling(252).std().mean().mean()
+        rets = prices.pct_change().dropna().to_numpy(dtype=float)
+        recent_vol = rets[-20:].std(axis=0, ddof=1).mean() if len(rets) >= 20 else np.nan
+        long_vol = _mean_rolling_std(rets, 252).mean()
         w_tr, w_mr = (0.7, 0.3) if recent_vol <= long_vol else (0.4, 0.6)
         return {s: w_tr * tr.get(s, 0.0) + w_mr * mr.get(s, 0.0) for s in self.symbols}
 
     def _forecasts(self, prices: pd.DataFrame, signals: Dict[str, float]) -> np.ndarray:
         rets = prices.pct_change().dropna()
-        ann_vol = (rets.std() * np.sqrt(252)).replace(0, np.nan)
-        z = pd.Series(signals).reindex(self.symbols).fillna(0.0)
-        scaled = (z / ann_vol).replace([np.inf, -np.inf], 0.0).fillna(0.0)
+        ann_vol = rets.std().to_numpy(dtype=float) * np.sqrt(252)
+        z = pd.Series(signals).reindex(self.symbols).fillna(0.0).to_numpy(dtype=float)
+        # Zero or missing vol gives a non-finite ratio, which maps to no view
+        with np.errstate(divide="ignore", invalid="ignore"):
+            scaled = np.nan_to_num(z / ann_vol, nan=0.0, posinf=0.0, neginf=0.0)
         # Clamp and convert to annualized expected return (conservative)
-        mu = 0.5 * scaled.clip(-3, 3).values / np.sqrt(252)
+        mu = 0.5 * np.clip(scaled, -3, 3) / np.sqrt(252)
         return mu.astype(float)
 
     def _cov(self, prices: pd.DataFrame) -> np.ndarray:
@@ -102,11 +127,13 @@ class BacktestEngine:
             cash_ratio = max(self.risk.min_cash, 1.0 - w_target.sum())
 
         # Rebalance costs (slippage + fees) on dollar turnover
-        turnover = np.abs(w_target - self.w).sum()
+        np.subtract(w_target, self.w, out=self._scratch)
+        np.abs(self._scratch, out=self._scratch)
+        turnover = self._scratch.sum()
         trading_cost = self.nav * turnover * (self.fee + self.spread)
 
         # Next-day PnL using simple close-to-close returns
-        day_ret_vec = self.data[self.symbols].pct_change().iloc[t].values.astype(float)
+        day_ret_vec = self._day_returns[t]
         port_ret = float(np.dot(self.w, day_ret_vec))
         self.nav = self.nav * (1.0 + port_ret) - trading_cost
 
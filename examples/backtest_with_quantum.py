@@ -49,6 +49,10 @@ class QuantumBacktestEngine:
         if use_quantum:
             self.quantum_available = setup_quantum_environment()
 
+        # Daily close-to-close returns, computed once and read by row position in step()
+        self._day_returns = self.data[self.symbols].pct_change().to_numpy(dtype=float)
+        self._scratch = np.empty(len(self.symbols))  # reused for turnover deltas
+
         self.nav_history: List[float] = []
         self.cr_history: List[float] = []
         self.optimization_methods: List[str] = []
@@ -116,11 +120,13 @@ class QuantumBacktestEngine:
             cash_ratio = max(self.risk.min_cash, 1.0 - w_target.sum())
 
         # Rebalance costs
-        turnover = np.abs(w_target - self.w).sum()
+        np.subtract(w_target, self.w, out=self._scratch)
+        np.abs(self._scratch, out=self._scratch)
+        turnover = self._scratch.sum()
         trading_cost = self.nav * turnover * (self.fee + self.spread)
 
         # Next-day PnL
-        day_ret_vec = self.data[self.symbols].pct_change().iloc[t].values.astype(float)
+        day_ret_vec = self._day_returns[t]
         port_ret = float(np.dot(self.w, day_ret_vec))
         self.nav = self.nav * (1.0 + port_ret) - trading_cost
 
@@ -19,3 +19,37 @@ def test_full_pipeline_step(tmp_path):
     res = orch.step(date, window, {"principal":100000,"rate":0.08,"term_months":36}, portfolio_value=60000, loan_id="demo")
     assert set(["target_weights","execution_result","coverage_ratio","risk_metrics","rationale"]).issubset(res.keys())
     assert isinstance(res["rationale"], list) and len(res["rationale"]) >= 1
+
+
+def test_consecutive_steps_carry_weights(tmp_path):
+    cfg = {"signals": {}, "optimizer": {}, "coverage": {}, "execution": {"spread_bps": {"VTI": 1, "BND": 2, "VTIP": 3}}}
+    orch = TradingOrchestrator(cfg)
+    prices = pd.read_csv(make_universe_csv(str(tmp_path / "sample.csv")), index_col="date", parse_dates=True)
+    loan = {"principal": 100000, "rate": 0.08, "term_months": 36}
+    for k in (260, 261, 262):
+        res = orch.step(prices.index[k], prices.iloc[: k + 1], loan, portfolio_value=60000)
+    assert orch.current_weights is not None
+    assert res["risk_metrics"]["turnover"] >= 0.0
+
+
+def test_revised_interior_prices_force_a_fresh_estimate(tmp_path):
+    import numpy as np
+
+    cfg = {"signals": {}, "optimizer": {}, "coverage": {}, "execution": {"spread_bps": {"VTI": 1, "BND": 2, "VTIP": 3}}}
+    prices = pd.read_csv(make_universe_csv(str(tmp_path / "sample.csv")), index_col="date", parse_dates=True)
+    loan = {"principal": 100000, "rate": 0.08, "term_months": 36}
+    streamed = TradingOrchestrator(cfg)
+    streamed.step(prices.index[300], prices.iloc[:301], loan, portfolio_value=60000)
+
+    # Revise one price well inside the window the next step shares with this one
+    revised = prices.copy()
+    revised.iloc[150, 0] *= 1.5
+    res = streamed.step(revised.index[301], revised.iloc[:302], loan, portfolio_value=60000)
+
+    fresh = TradingOrchestrator(cfg)
+    expected = fresh.step(revised.index[301], revised.iloc[:302], loan, portfolio_value=60000)
+    pd.testing.assert_series_equal(res["target_weights"], expected["target_weights"], rtol=1e-9)
+    np.testing.assert_allclose(
+        streamed.optimizer.folded_column_std(), fresh.optimizer.folded_column_std(), rtol=1e-9
+    )
+    assert res["rationale"] == expected["rationale"]
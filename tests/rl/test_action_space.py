@@ -0,0 +1,17 @@
+# tests/rl/test_action_space.py
+from alphashield.rl.context import build_action_space
+
+
+def test_action_space_copies_do_not_share_state():
+    space = build_action_space("Lender")
+    space["actions"].append("mutated")
+    space["n_actions"] = 0
+
+    fresh = build_action_space("Lender")
+    assert fresh["n_actions"] == 9
+    assert "mutated" not in fresh["actions"]
+    assert len(fresh["actions"]) == fresh["n_actions"]
+
+    default = build_action_space("Unknown")
+    default["actions"].clear()
+    assert build_action_space("Unknown")["actions"] == ["low", "medium", "high"]
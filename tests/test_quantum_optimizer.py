@@ -240,6 +240,17 @@ class TestPerformanceTracker(unittest.TestCase):
         # Drawdown should be negative
         self.assertLess(max_dd, 0)
 
+    def test_calculate_max_drawdown_skips_missing_returns(self):
+        """Missing returns are skipped; no data gives NaN rather than zero drawdown"""
+        tracker = PerformanceTracker()
+
+        returns = pd.Series([np.nan, -0.5, 0.2, np.nan, -0.1])
+        cumulative = (1 + returns).cumprod()
+        expected = float(((cumulative - cumulative.cummax()) / cumulative.cummax()).min())
+        self.assertAlmostEqual(tracker._calculate_max_drawdown(returns), expected)
+        self.assertTrue(np.isnan(tracker._calculate_max_drawdown(pd.Series([], dtype=float))))
+        self.assertTrue(np.isnan(tracker._calculate_max_drawdown(pd.Series([np.nan, np.nan]))))
+
 
 if __name__ == '__main__':
     unittest.main()
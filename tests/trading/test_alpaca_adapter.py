@@ -45,6 +45,12 @@ class TestAlpacaAdapterBase:
         """Test TimeInForce enum values."""
         assert TimeInForce.DAY.value == "day"
         assert TimeInForce.GTC.value == "gtc"
+    
+    def test_enum_by_value(self):
+        """Test direct value lookup on enums."""
+        assert TimeInForce.by_value("ioc") is TimeInForce.IOC
+        assert OrderStatus.by_value("filled") is OrderStatus.FILLED
+        assert OrderType.by_value("bogus", OrderType.MARKET) is OrderType.MARKET
 
 
 class TestPosition:
@@ -139,14 +145,14 @@ class TestQuote:
         quote = Quote(
             symbol="AAPL",
             timestamp=datetime.now(timezone.utc),
-            bid=Decimal("150.00"),
+            bid=150.00,
             bid_size=100,
-            ask=Decimal("150.05"),
+            ask=150.05,
             ask_size=200,
         )
         
-        assert quote.spread == Decimal("0.05")
-        assert quote.mid_price == Decimal("150.025")
+        assert quote.spread == pytest.approx(0.05)
+        assert quote.mid_price == pytest.approx(150.025)
 
 
 class TestAccountInfo:
@@ -180,16 +186,36 @@ class TestBar:
         bar = Bar(
             symbol="SPY",
             timestamp=datetime.now(timezone.utc),
-            open=Decimal("450.00"),
-            high=Decimal("452.00"),
-            low=Decimal("449.00"),
-            close=Decimal("451.50"),
+            open=450.00,
+            high=452.00,
+            low=449.00,
+            close=451.50,
             volume=1000000,
         )
         
         assert bar.symbol == "SPY"
         assert bar.high > bar.low
 
+    def test_bar_batch_from_bars(self):
+        """Test converting Bars into column arrays."""
+        from alphashield.trading.adapters.base import Bar, BarBatch
+        
+        ts = datetime(2024, 1, 2, 21, tzinfo=timezone.utc)
+        bars = [
+            Bar(symbol="SPY", timestamp=ts, open=450.00, high=452.00,
+                low=449.00, close=451.50, volume=1000000),
+            Bar(symbol="SPY", timestamp=ts, open=451.50, high=455.00,
+                low=451.00, close=454.25, volume=1200000),
+        ]
+        
+        batch = BarBatch.from_bars("SPY", bars)
+        
+        assert len(batch) == 2
+        assert batch.close.dtype == "float64"
+        assert batch.volume.dtype == "int64"
+        assert batch.close.tolist() == [451.5, 454.25]
+        assert str(batch.timestamp[0]).startswith("2024-01-02T21:00")
+
 
 class TestAlpacaAdapterInit:
     """Test AlpacaAdapter initialization."""
@@ -27,3 +27,43 @@ def test_backtester_metrics_shape_and_ranges(tmp_path):
         assert k in metrics
         assert isinstance(metrics[k], float)
     assert 0.0 <= metrics["max_drawdown"] <= 1.0
+
+
+def test_run_parallel_matches_sequential_runs(tmp_path):
+    prices = pd.read_csv(make_universe_csv(str(tmp_path / "sample.csv")), index_col="date", parse_dates=True)
+    cfg = {"execution": {"spread_bps": {"VTI": 1, "BND": 2, "VTIP": 3}}}
+    loan = {"principal": 100000, "rate": 0.08, "term_months": 36}
+    runs = [{"loan_params": loan, "initial_capital": cap} for cap in (60000.0, 120000.0)]
+    bt = Backtester(cfg)
+    parallel = bt.run_parallel(prices, runs, max_workers=2)
+    for kwargs, res in zip(runs, parallel, strict=True):
+        expected = bt.run(prices, **kwargs)
+        pd.testing.assert_series_equal(res["nav"], expected["nav"])
+        assert res["metrics"] == expected["metrics"]
+
+
+def test_signal_window_matches_full_history_across_gaps(tmp_path, monkeypatch):
+    import alphashield.trading.backtester as backtester
+
+    prices = pd.read_csv(make_universe_csv(str(tmp_path / "sample.csv")), index_col="date", parse_dates=True)
+    # A gap exactly where the first rebalance's trailing window begins: momentum pads it
+    # from the row before, which the window must still include
+    first = prices.index.get_indexer(
+        prices.index.to_series().resample("M").last().index.intersection(prices.index)
+    )
+    i = int(first[first + 1 >= 252][0])
+    prices.iloc[i - 252 : i - 249, 0] = np.nan
+
+    seen = []
+    real_signal = backtester.combined_signal
+
+    def recording_signal(window, **kwargs):
+        seen.append((window, kwargs))
+        return real_signal(window, **kwargs)
+
+    monkeypatch.setattr(backtester, "combined_signal", recording_signal)
+    Backtester({"execution": {"spread_bps": {}}}).run(prices, {"principal": 100000, "rate": 0.08, "term_months": 36})
+    assert seen
+    for window, kwargs in seen:
+        full = prices.loc[: window.index[-1]]
+        pd.testing.assert_series_equal(real_signal(window, **kwargs), real_signal(full, **kwargs))
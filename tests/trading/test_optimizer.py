@@ -1,5 +1,6 @@
 import numpy as np
 import pandas as pd
+import pytest
 from alphashield.trading.portfolio_optimizer import PortfolioOptimizer, OptimizerConfig
 
 
@@ -35,3 +36,123 @@ def test_optimizer_min_return_fallback_to_risk_off():
     w, info = opt.optimize(mu, r)
     assert info.get("status") in {"fallback_risk_off","ok"}
     assert abs(w.sum() - 1.0) < 1e-6
+
+
+def test_optimize_streaming_matches_full_estimate():
+    idx = pd.bdate_range("2020-01-01", periods=300)
+    rng = np.random.default_rng(2)
+    r = pd.DataFrame(rng.normal(0.0003, 0.01, size=(len(idx), 3)), index=idx, columns=["VTI", "BND", "VTIP"])
+    mu = pd.Series({"VTI": 0.08, "BND": 0.03, "VTIP": 0.02})
+    for cov in ("ledoit_wolf", "ewma"):
+        cfg = OptimizerConfig(covariance=cov, max_position=0.6)
+        full, streaming = PortfolioOptimizer(cfg), PortfolioOptimizer(cfg)
+        for end in (120, 200, 300):
+            w_full, _ = full.optimize(mu, r.iloc[:end])
+            w_stream, _ = streaming.optimize_streaming(mu, r.to_numpy(), end)
+            np.testing.assert_allclose(w_stream.to_numpy(), w_full.to_numpy(), rtol=1e-8, atol=1e-10)
+
+
+def test_optimize_streaming_sliding_window_matches_full_estimate():
+    idx = pd.bdate_range("2020-01-01", periods=400)
+    rng = np.random.default_rng(4)
+    r = pd.DataFrame(rng.normal(0.0003, 0.01, size=(len(idx), 3)), index=idx, columns=["VTI", "BND", "VTIP"])
+    mu = pd.Series({"VTI": 0.0008, "BND": 0.0006, "VTIP": 0.0004})
+    for cov in ("ledoit_wolf", "ewma"):
+        cfg = OptimizerConfig(covariance=cov, risk_aversion=10.0, max_position=0.9)
+        full, streaming = PortfolioOptimizer(cfg), PortfolioOptimizer(cfg)
+        for end in range(150, 400, 25):
+            start = end - 120
+            w_full, _ = full.optimize(mu, r.iloc[start:end])
+            w_stream, _ = streaming.optimize_streaming(mu, r.to_numpy(), end, start=start)
+            np.testing.assert_allclose(w_stream.to_numpy(), w_full.to_numpy(), rtol=1e-8, atol=1e-10)
+
+
+def test_optimize_streaming_reuses_factor_only_for_unchanged_window():
+    idx = pd.bdate_range("2020-01-01", periods=200)
+    rng = np.random.default_rng(6)
+    r = pd.DataFrame(rng.normal(0.0003, 0.01, size=(len(idx), 3)), index=idx, columns=["VTI", "BND", "VTIP"])
+    cfg = OptimizerConfig(risk_aversion=10.0, max_position=0.9)
+    full, streaming = PortfolioOptimizer(cfg), PortfolioOptimizer(cfg)
+    for end, scale in ((150, 1.0), (150, -0.5), (200, 1.0)):
+        mu = pd.Series({"VTI": 0.0008, "BND": 0.0006, "VTIP": 0.0004}) * scale
+        w_full, _ = full.optimize(mu, r.iloc[:end])
+        w_stream, _ = streaming.optimize_streaming(mu, r.to_numpy(), end)
+        np.testing.assert_allclose(w_stream.to_numpy(), w_full.to_numpy(), rtol=1e-8, atol=1e-10)
+
+
+def test_classical_shrinkage_is_deterministic_and_preserves_trace():
+    from alphashield.trading.classical_optimizer import ClassicalPortfolioOptimizer
+
+    rng = np.random.default_rng(3)
+    a = rng.normal(size=(5, 5))
+    sigma = a @ a.T / 5 * 0.04
+    opt = ClassicalPortfolioOptimizer()
+    shrunk = opt._shrink_covariance(sigma)
+    np.testing.assert_allclose(shrunk, opt._shrink_covariance(sigma))
+    assert np.trace(shrunk) == pytest.approx(np.trace(sigma))
+    assert np.linalg.eigvalsh(shrunk).min() > 0
+
+
+def test_classical_problem_cache_is_bounded():
+    from itertools import combinations
+
+    from alphashield.trading.classical_optimizer import _MAX_CACHED_PROBLEMS, ClassicalPortfolioOptimizer
+
+    rng = np.random.default_rng(4)
+    a = rng.normal(size=(4, 4))
+    sigma = a @ a.T / 4 * 0.04
+    mu = np.array([0.05, 0.04, 0.03, 0.02])
+    opt = ClassicalPortfolioOptimizer()
+    # Each sector grouping compiles its own problem; old groupings must not pile up
+    groups = [g for size in (1, 2, 3) for g in combinations(range(4), size)]
+    for group in groups[: _MAX_CACHED_PROBLEMS + 3]:
+        cons = {"max_weight": 0.6, "sector_limits": {"s": (list(group), 0.5)}}
+        w = opt.optimize(mu, sigma, constraints=cons)
+        assert w.sum() == pytest.approx(1.0, abs=1e-6)
+    assert len(opt._problems) == _MAX_CACHED_PROBLEMS
+    assert next(reversed(opt._problems))[1] == (group,)
+
+
+def test_float32_covariance_close_to_float64():
+    idx = pd.bdate_range("2020-01-01", periods=252)
+    rng = np.random.default_rng(5)
+    r = pd.DataFrame(rng.normal(0.0003, 0.01, size=(len(idx), 4)), index=idx, columns=list("ABCD"))
+    mu = pd.Series({"A": 0.0008, "B": 0.0006, "C": 0.0004, "D": 0.0005})
+    for cov in ("ledoit_wolf", "ewma"):
+        w64, _ = PortfolioOptimizer(OptimizerConfig(covariance=cov, risk_aversion=10.0, max_position=0.9)).optimize(mu, r)
+        cfg32 = OptimizerConfig(covariance=cov, risk_aversion=10.0, max_position=0.9, covariance_dtype="float32")
+        w32, _ = PortfolioOptimizer(cfg32).optimize(mu, r)
+        np.testing.assert_allclose(w32.to_numpy(), w64.to_numpy(), atol=1e-4)
+
+
+def test_numpy_ledoit_wolf_matches_sklearn():
+    covariance = pytest.importorskip("sklearn.covariance")
+    from alphashield.trading.portfolio_optimizer import _ledoit_wolf_fast
+
+    rng = np.random.default_rng(7)
+    for n, p in ((5, 3), (252, 1), (252, 8), (40, 60)):
+        x = rng.normal(0.0, 0.01, size=(n, p))
+        np.testing.assert_allclose(_ledoit_wolf_fast(x), covariance.ledoit_wolf(x)[0], rtol=1e-10, atol=1e-16)
+
+
+def test_optimize_arrays_matches_pandas_wrapper():
+    idx = pd.bdate_range("2020-01-01", periods=120)
+    rng = np.random.default_rng(8)
+    r = pd.DataFrame(rng.normal(0.0003, 0.01, size=(len(idx), 3)), index=idx, columns=["VTI", "BND", "VTIP"])
+    r.iloc[10, 1] = np.nan
+    mu = pd.Series({"VTI": 0.0008, "BND": 0.0006, "VTIP": 0.0004})
+    opt = PortfolioOptimizer(OptimizerConfig(risk_aversion=10.0, max_position=0.9))
+    w_series, info = opt.optimize(mu, r)
+    w, info_arr = opt.optimize_arrays(mu.to_numpy(), r.to_numpy(), list(mu.index))
+    np.testing.assert_allclose(w, w_series.to_numpy())
+    assert info == info_arr
+
+
+def test_default_constraints_read_as_a_mapping():
+    from alphashield.trading.models.constraints import default_constraints
+
+    cons = default_constraints()
+    assert "max_weight" in cons and "missing" not in cons
+    assert list(cons) == ["risk_aversion", "max_weight", "max_turnover", "sector_limits"]
+    assert dict(**cons) == {"risk_aversion": 1.0, "max_weight": 0.20, "max_turnover": 0.30, "sector_limits": {}}
+    assert cons == dict(cons.items())
@@ -0,0 +1,37 @@
+import math
+
+import pytest
+
+from alphashield.trading.portfolio_tracker import PortfolioTracker
+
+
+def test_unheld_ticker_price_does_not_affect_valuation():
+    tracker = PortfolioTracker(positions={"A": 10})
+    tracker.update_price("A", 5)
+    tracker.update_price("B", math.nan)
+    tracker.update_price("C", math.inf)
+    assert tracker.get_total_value() == 50.0
+    assert tracker.get_weights() == {"A": 1.0}
+    assert tracker.get_drawdown() == 0.0
+
+
+def test_positions_and_prices_are_read_only_until_reassigned():
+    tracker = PortfolioTracker(positions={"A": 10, "B": 1}, prices={"A": 5, "B": 2})
+    with pytest.raises(TypeError):
+        tracker.positions["A"] = 20
+    with pytest.raises(TypeError):
+        tracker.prices["A"] = 6
+    assert tracker.get_total_value() == 52.0
+
+    tracker.positions = {"A": 20}
+    tracker.prices = {"A": 6}
+    assert dict(tracker.positions) == {"A": 20.0}
+    assert dict(tracker.prices) == {"A": 6.0}
+    assert tracker.get_total_value() == 120.0
+
+
+def test_repr_and_equality_follow_state():
+    tracker = PortfolioTracker(positions={"A": 10}, prices={"A": 5})
+    assert tracker == PortfolioTracker(positions={"A": 10}, prices={"A": 5})
+    assert tracker != PortfolioTracker(positions={"A": 11}, prices={"A": 5})
+    assert repr(tracker) == "PortfolioTracker(positions={'A': 10.0}, prices={'A': 5.0}, _peak_value=0.0)"
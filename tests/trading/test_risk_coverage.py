@@ -1,7 +1,14 @@
 import numpy as np
 import pandas as pd
 
-from alphashield.trading.coverage_monitor import monthly_payment, coverage_ratio, is_coverage_ok
+from alphashield.trading.coverage_monitor import (
+    monthly_payment,
+    monthly_payment_batch,
+    coverage_ratio,
+    coverage_ratio_batch,
+    is_coverage_ok,
+)
+from alphashield.trading.coverage_ratio_monitor import CoverageRatioMonitor
 from alphashield.trading.risk_manager import RiskManager
 
 
@@ -34,3 +41,49 @@ def test_risk_manager_defensive_on_breach():
     assert dd > 0.15
     decision = rm.emergency_mode_check(coverage_ratio=1.25, portfolio_drawdown=dd)
     assert decision.action in {"emergency", "defensive"}
+
+
+def test_coverage_ratio_monitor_status_batch_matches_scalar():
+    mon = CoverageRatioMonitor(target_min=1.3, emergency_min=1.2)
+    crs = np.array([0.5, 1.2, 1.25, 1.3, 2.0, np.inf, np.nan])
+    expected = ["emergency", "defensive", "defensive", "normal", "normal", "normal", "normal"]
+    assert [mon.status(c) for c in crs] == expected
+    assert mon.status_batch(crs).tolist() == expected
+
+
+def test_coverage_ratio_monitor_reads_current_thresholds():
+    mon = CoverageRatioMonitor(target_min=1.3, emergency_min=1.2)
+    mon.target_min = 1.6
+    assert mon.status(1.5) == "defensive"
+    # Emergency checked first, even when the thresholds are inverted
+    inverted = CoverageRatioMonitor(target_min=1.1, emergency_min=1.2)
+    crs = np.array([1.05, 1.15, 1.25])
+    assert [inverted.status(c) for c in crs] == ["emergency", "emergency", "normal"]
+    assert inverted.status_batch(crs).tolist() == ["emergency", "emergency", "normal"]
+
+
+def test_coverage_batch_helpers_match_scalar():
+    principals = np.array([100000.0, 50000.0, 20000.0, 10000.0])
+    rates = np.array([0.08, 0.0, 0.05, 0.07])
+    terms = np.array([36, 24, 0, 60])
+    pmts = monthly_payment_batch(principals, rates, terms)
+    expected = [monthly_payment(p, r, int(t)) for p, r, t in zip(principals, rates, terms, strict=True)]
+    np.testing.assert_allclose(pmts, expected)
+
+    navs = np.array([60000.0, 30000.0, 10000.0, 5000.0])
+    crs = coverage_ratio_batch(navs, pmts, exp_return_assumption=0.12)
+    expected = [coverage_ratio(n, p, exp_return_assumption=0.12) for n, p in zip(navs, pmts, strict=True)]
+    np.testing.assert_allclose(crs, expected)
+
+
+def test_var_cvar_match_percentile_definition():
+    rng = np.random.default_rng(0)
+    rm = RiskManager()
+    for n in (1, 2, 7, 250):
+        r = rng.normal(0.0, 0.01, size=n)
+        for conf in (0.5, 0.9, 0.95, 0.99):
+            var = np.percentile(r, (1 - conf) * 100)
+            assert rm.calculate_var(r, conf) == var
+            np.testing.assert_allclose(rm.calculate_cvar(r, conf), r[r <= var].mean(), rtol=1e-12)
+            assert rm.calculate_var_cvar(r, conf) == (rm.calculate_var(r, conf), rm.calculate_cvar(r, conf))
+    assert rm.calculate_var_cvar(np.array([]), 0.95) == (0.0, 0.0)
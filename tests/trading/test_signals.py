@@ -1,7 +1,7 @@
 import pandas as pd
 import numpy as np
 from tests.trading.fixtures.synthetic_prices import gbm_prices
-from alphashield.trading.signal_generator import momentum_signal, trend_sma200_signal, mean_reversion_signal, combine_signals
+from alphashield.trading.signal_generator import momentum_signal, trend_sma200_signal, mean_reversion_signal, combine_signals, combined_signal
 
 
 def test_momentum_and_trend_rank_uptrend_highest():
@@ -44,3 +44,22 @@ def test_combine_signals_weighting_and_bounds():
     mr = mean_reversion_signal(prices)
     combo = combine_signals({"momentum": mom, "trend": tr, "meanrev": mr}, weights={"momentum":0.5,"trend":0.3,"meanrev":0.2})
     assert (combo>=0.0).all() and (combo<=1.0).all()
+
+
+def test_combined_signal_matches_component_pipeline():
+    prices = pd.concat(
+        [gbm_prices(100, 0.07, 0.15, 300, seed=s) for s in (1, 2, 3)], axis=1, keys=["VTI", "BND", "VTIP"]
+    )
+    prices.iloc[[10, 120], 1] = np.nan
+    weights = {"momentum": 0.5, "trend": 0.3, "meanrev": 0.2}
+    for window in (prices, prices.iloc[:150]):
+        ref = combine_signals(
+            {
+                "momentum": momentum_signal(window),
+                "trend": trend_sma200_signal(window),
+                "meanrev": mean_reversion_signal(window),
+            },
+            weights,
+        )
+        out = combined_signal(window, weights=weights)
+        pd.testing.assert_series_equal(out, ref, rtol=1e-9, atol=1e-9)
@@ -402,7 +402,14 @@ class PerformanceTracker:
     
     def _calculate_max_drawdown(self, returns: pd.Series) -> float:
         """Calculate maximum drawdown from returns series"""
-        cumulative = (1 + returns).cumprod()
-        running_max = cumulative.cummax()
-        drawdown = (cumulative - running_max) / running_max
-        return float(drawdown.min())
+        r = np.asarray(returns, dtype=float)
+        # Missing returns are skipped, as pandas' cumprod/cummax/min do; with no data
+        # left the drawdown is undefined (NaN), not zero
+        r = r[~np.isnan(r)]
+        if r.size == 0:
+            return float("nan")
+        cumulative = np.cumprod(1.0 + r)
+        running_max = np.maximum.accumulate(cumulative)
+        cumulative -= running_max
+        cumulative /= running_max
+        return float(cumulative.min())
@@ -12,9 +12,12 @@ def meanrev_signals(prices: pd.DataFrame, window: int = 20) -> Dict[str, float]:
         if len(s) < window + 1:
             out[symbol] = 0.0
             continue
-        sma = s.rolling(window).mean().iloc[-1]
-        std = s.rolling(window).std().iloc[-1]
-        px = s.iloc[-1]
+        # Only the latest band is used, so take the stats of the trailing window directly
+        tail = s.to_numpy(dtype=float)[-window:]
+        sma = tail.mean()
+        # A flat window has zero std exactly, as pandas' rolling kernel reports it
+        std = tail.std(ddof=1) if tail.max() != tail.min() else 0.0
+        px = tail[-1]
         if std > 0:
             band_pos = (px - sma) / (2 * std)
             out[symbol] = float(np.clip(-band_pos, -1.0, 1.0))